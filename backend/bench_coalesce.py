@@ -0,0 +1,95 @@
+"""
+요청 병합(single-flight) 스탬피드 확인
+
+같은 파라미터의 /api/hotels 요청 N개(기본 500)를 동시에 보내고
+실제 DB 조회(fetch_hotel_page)가 1번만 실행되는지 확인합니다.
+임시 SQLite DB를 사용하므로 PostgreSQL 없이 실행할 수 있습니다.
+
+    python bench_coalesce.py [--requests 500]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+db_path = os.path.join(tempfile.mkdtemp(), "coalesce.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+
+from sqlalchemy import event
+
+import main
+import queries
+from database import Base, SessionLocal, engine
+from models import Hotel
+
+
+def seed(count=200):
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    db.bulk_insert_mappings(Hotel, [
+        {"name": f"호텔 {i}", "address": "서울특별시", "category": "B02010100", "content_id": str(i)}
+        for i in range(count)
+    ])
+    db.commit()
+    db.close()
+
+
+def run(num_requests):
+    counts = {"fetch": 0, "statements": 0}
+    fetch_hotel_page = queries.fetch_hotel_page
+
+    def counted_fetch(db, *args):
+        counts["fetch"] += 1
+        # 느린 DB를 흉내: 모든 요청이 진행 중인 조회에 합류할 때까지 대기
+        key = main.listing_key(*args)
+        deadline = time.monotonic() + 5
+        while main.hotel_page_flight.waiters(key) < num_requests - 1 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        return fetch_hotel_page(db, *args)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def count_statements(*args):
+        counts["statements"] += 1
+
+    queries.fetch_hotel_page = counted_fetch
+
+    barrier = threading.Barrier(num_requests)
+    totals = []
+
+    def request():
+        barrier.wait()
+        response = main.get_hotels(page=1, limit=20, category="B02010100", search=None, location=None, format="full")
+        totals.append(response["total"])
+
+    threads = [threading.Thread(target=request) for _ in range(num_requests)]
+    started = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - started
+
+    return counts, totals, elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    seed()
+    counts, totals, elapsed = run(args.requests)
+
+    print("="*60)
+    print(f"동시 요청: {args.requests}개 ({elapsed:.3f}s)")
+    print(f"응답 수: {len(totals)}개 (total 값: {sorted(set(totals))})")
+    print(f"DB 조회(fetch_hotel_page): {counts['fetch']}회")
+    print(f"실행된 SQL 문: {counts['statements']}개 (count + select)")
+    print("="*60)
+
+    if counts["fetch"] != 1 or len(totals) != args.requests:
+        print("❌ 요청 병합 실패")
+        sys.exit(1)
+    print("✅ 모든 요청이 DB 조회 1회를 공유했습니다")
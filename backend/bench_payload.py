@@ -0,0 +1,70 @@
+"""
+/api/hotels 한 페이지 응답 크기 비교 (full vs compact, 무압축/gzip/brotli)
+
+    python bench_payload.py [--limit 20 100]
+
+DB 없이 copywriting.build_hotel_card로 목록 행을 만들어 실제 응답과 같은 방식(JSON, 공백 없는 구분자)으로 직렬화합니다.
+brotli는 설치되어 있을 때만 측정합니다.
+"""
+import argparse
+import gzip
+import json
+import random
+
+from compression import decode_compact, encode_compact
+from copywriting import build_hotel_card
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def serialize(payload):
+    # starlette JSONResponse와 같은 설정
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def sizes(body):
+    result = {"raw": len(body), "gzip": len(gzip.compress(body, compresslevel=9))}
+    if brotli:
+        # brotli-asgi 기본 quality
+        result["br"] = len(brotli.compress(body, quality=4))
+    return result
+
+
+def make_page(limit):
+    rows = [
+        {"id": i, "name": f"테스트 호텔 {i}", "address": "서울특별시 중구 을지로 30", "category": "B02010100"}
+        for i in range(1, limit + 1)
+    ]
+    hotels = [build_hotel_card(row) for row in rows]
+    full = {"total": 10000, "count": len(hotels), "hotels": hotels}
+    compact = {"total": 10000, "count": len(hotels), **encode_compact(hotels)}
+    return full, compact
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--limit", type=int, nargs="+", default=[20, 100])
+    args = parser.parse_args()
+
+    random.seed(0)
+    print("="*60)
+    print("📦 /api/hotels 페이지당 응답 크기 (bytes)")
+    print("="*60)
+
+    for limit in args.limit:
+        full, compact = make_page(limit)
+        assert decode_compact(compact) == full["hotels"]
+
+        full_sizes = sizes(serialize(full))
+        compact_sizes = sizes(serialize(compact))
+
+        print(f"\nlimit={limit}")
+        for encoding in full_sizes:
+            f, c = full_sizes[encoding], compact_sizes[encoding]
+            print(
+                f"  {encoding:<5} full {f:>7,}  compact {c:>7,}  "
+                f"(-{(1 - c / f) * 100:4.1f}%, 무압축 full 대비 -{(1 - c / full_sizes['raw']) * 100:4.1f}%)"
+            )
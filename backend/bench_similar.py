@@ -0,0 +1,77 @@
+"""
+비슷한 숙소 미리 계산 시간 측정
+
+    python bench_similar.py [--hotels 100000] [--k 10] [--write-sqlite]
+
+전국 범위의 가짜 숙소 N개로 특징 벡터 생성 + top-k 계산 시간을 잽니다.
+--write-sqlite를 주면 임시 SQLite DB에 저장까지 포함한 precompute_similar 전체 시간을 잽니다.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+CATEGORIES = ["B02010100", "B02010500", "B02010700", "B02010900", "B02011100", "B02011600", "A02030100"]
+
+
+def fake_rows(n, seed=0):
+    rng = np.random.default_rng(seed)
+    # 대한민국 대략적 범위 (위도 33~38.5, 경도 126~129.5)
+    lat = rng.uniform(33.0, 38.5, n)
+    lon = rng.uniform(126.0, 129.5, n)
+    category = rng.choice(CATEGORIES, n)
+    return [(i + 1, category[i], float(lat[i]), float(lon[i])) for i in range(n)]
+
+
+def bench_compute(rows, k):
+    from similar import compute_similar
+
+    started = time.perf_counter()
+    ids, neighbour_ids, scores = compute_similar(rows, k=k)
+    elapsed = time.perf_counter() - started
+    assert neighbour_ids.shape == (len(rows), k)
+    assert not (neighbour_ids == ids[:, None]).any(), "자기 자신이 이웃에 포함됨"
+    return elapsed
+
+
+def bench_write(rows, k):
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'similar.db')}"
+
+    from database import Base, get_engine
+    from models import Hotel
+    from similar import precompute_similar
+
+    engine = get_engine()
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(Hotel.__table__.insert(), [
+            {"id": r[0], "name": f"호텔 {r[0]}", "category": r[1], "latitude": r[2], "longitude": r[3], "content_id": str(r[0])}
+            for r in rows
+        ])
+    return precompute_similar(engine, k=k)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--hotels", type=int, default=100_000)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--write-sqlite", action="store_true")
+    args = parser.parse_args()
+
+    rows = fake_rows(args.hotels)
+
+    print("="*60)
+    print(f"🧮 비슷한 숙소 미리 계산 (숙소 {args.hotels:,}개, k={args.k})")
+    print("="*60)
+    elapsed = bench_compute(rows, args.k)
+    print(f"특징 벡터 + top-k 계산: {elapsed:.2f}s ({args.hotels / elapsed:,.0f}개/s)")
+
+    if args.write_sqlite:
+        result = bench_write(rows, args.k)
+        print(f"DB 조회 + 계산 + 저장(SQLite): {result['total_seconds']:.2f}s ({result['rows']:,}행)")
+
+    import resource  # 유닉스 전용 (ru_maxrss 단위: Linux KB)
+
+    print(f"최대 RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:,.0f}MB")
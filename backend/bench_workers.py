@@ -0,0 +1,151 @@
+"""
+워커 수별 처리량 비교 (/api/hotels)
+
+serve.py로 서버를 워커 1개, N개로 각각 띄운 뒤 같은 부하를 주고 초당 요청 수를 비교합니다.
+
+    python bench_workers.py [--workers 4] [--concurrency 64] [--duration 10] [--seed-sqlite 2000]
+
+--seed-sqlite를 주면 임시 SQLite DB에 숙소 N개를 채워서 사용하고,
+없으면 .env의 DATABASE_URL을 그대로 사용합니다.
+
+매 요청이 DB와 워커별 커넥션 풀을 거치도록, 서버의 주기 작업(캐시 워밍업 등)을 끄고
+요청마다 1~--pages 페이지를 돌아가며 조회합니다.
+"""
+import argparse
+import itertools
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from serve import cpu_count
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# 벤치마크 서버에서는 listing_cache를 채우는 워밍업 등 주기 작업을 끔
+SERVER_ENV = {
+    "CACHE_WARMUP_MINUTES": "0",
+    "STATS_REFRESH_MINUTES": "0",
+    "SYNC_INTERVAL_MINUTES": "0",
+    "SIMILAR_DAILY_AT": "",
+}
+
+
+def seed_sqlite(count):
+    db_path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+
+    from database import Base, SessionLocal, engine
+    from models import Hotel
+
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    db.bulk_insert_mappings(Hotel, [
+        {"name": f"호텔 {i}", "address": "서울특별시 중구", "category": "B02010100", "content_id": str(i)}
+        for i in range(count)
+    ])
+    db.commit()
+    db.close()
+
+
+def wait_ready(url, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(url, timeout=1).read()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"서버가 {timeout}초 안에 뜨지 않았습니다: {url}")
+
+
+def load(urls, concurrency, duration):
+    """duration초 동안 concurrency개 클라이언트가 urls를 돌아가며 쉬지 않고 요청"""
+    next_url = itertools.cycle(urls).__next__
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    stop_at = time.monotonic() + duration
+
+    def client():
+        while time.monotonic() < stop_at:
+            with lock:
+                url = next_url()
+            started = time.perf_counter()
+            try:
+                urllib.request.urlopen(url, timeout=10).read()
+            except OSError:
+                with lock:
+                    errors[0] += 1
+                continue
+            with lock:
+                latencies.append(time.perf_counter() - started)
+
+    with ThreadPoolExecutor(concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(client)
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors[0],
+        "rps": len(latencies) / duration,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0,
+        "p95_ms": latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0,
+    }
+
+
+def bench(workers, args):
+    port = args.port
+    server = subprocess.Popen(
+        [sys.executable, "serve.py", "--workers", str(workers), "--port", str(port), "--host", "127.0.0.1"],
+        cwd=HERE,
+        env={**os.environ, **SERVER_ENV},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        base = f"http://127.0.0.1:{port}"
+        wait_ready(base + "/")
+        urls = [f"{base}/api/hotels?page={page}&limit={args.limit}" for page in range(1, args.pages + 1)]
+        load(urls, args.concurrency, 1)  # 워밍업
+        return load(urls, args.concurrency, args.duration)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=cpu_count())
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=50, help="돌아가며 조회할 페이지 수")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed-sqlite", type=int)
+    args = parser.parse_args()
+
+    if args.seed_sqlite:
+        seed_sqlite(args.seed_sqlite)
+        args.pages = min(args.pages, max(-(-args.seed_sqlite // args.limit), 1))
+
+    results = {n: bench(n, args) for n in sorted({1, args.workers})}
+
+    print("="*60)
+    print(f"📊 /api/hotels 처리량 (동시 접속 {args.concurrency}, {args.duration:.0f}초, 페이지 1~{args.pages})")
+    print("="*60)
+    for workers, r in results.items():
+        print(
+            f"  워커 {workers:>2}개: {r['rps']:>8.1f} req/s  "
+            f"p50 {r['p50_ms']:>6.1f}ms  p95 {r['p95_ms']:>6.1f}ms  "
+            f"(요청 {r['requests']}, 실패 {r['errors']})"
+        )
+    if len(results) > 1:
+        speedup = results[args.workers]["rps"] / max(results[1]["rps"], 1e-9)
+        print(f"\n⚡ 워커 {args.workers}개 / 1개 = {speedup:.2f}배")
@@ -0,0 +1,44 @@
+"""
+프로세스 내 TTL 캐시
+통계·기본 목록처럼 자주 조회되고 잠깐 오래되어도 괜찮은 데이터를 담습니다.
+"""
+import threading
+import time
+
+
+class TTLCache:
+    def __init__(self, ttl_seconds=300):
+        self.ttl = ttl_seconds
+        self._data = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+
+# 카테고리별 통계 (/api/stats)
+stats_cache = TTLCache(ttl_seconds=600)
+
+# 검색어 없는 목록 페이지의 DB 조회 결과 (/api/hotels)
+listing_cache = TTLCache(ttl_seconds=300)
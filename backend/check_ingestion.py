@@ -0,0 +1,127 @@
+"""
+수집 파이프라인 실패 처리 확인 (네트워크·DB 없이)
+
+    python check_ingestion.py
+
+큐 크기보다 많은 항목을 흘려 보내면서
+1) write_batch가 예외를 내면, 2) parse가 한 항목에서 예외를 내면
+run()이 멈추지 않고 그 예외를 그대로 발생시키는지 확인합니다.
+API 호출 실패도 같은 방식으로 발생하는지, 녹화된 fixtures/를 어댑터가 파싱하는지,
+중복 제거가 좌표 없는 같은 이름 숙소를 주소로 구분하는지도 확인합니다.
+"""
+import os
+import sys
+import threading
+
+from ingestion import (
+    Deduper,
+    FixtureTransport,
+    HotelRegistryAdapter,
+    IngestionPipeline,
+    StaySearchAdapter,
+)
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+TIMEOUT = 10
+ITEMS_PER_PAGE = 500
+
+
+def fake_transport(url, params):
+    page = params["pageNo"]
+    return {"response": {"body": {"items": {"item": [
+        {
+            "contentid": f"{page}-{i}",
+            "title": f"숙소 {page}-{i}",
+            "addr1": "서울특별시",
+            "addr2": None,
+            "mapx": 127.0 + page + i * 0.01,
+            "mapy": 37.0,
+        }
+        for i in range(ITEMS_PER_PAGE)
+    ]}}}}
+
+
+class FailingParseAdapter(StaySearchAdapter):
+    def parse(self, item):
+        if item["contentid"] == "2-10":
+            raise KeyError("broken item")
+        return super().parse(item)
+
+
+def failing_transport(url, params):
+    raise ConnectionError("api unreachable")
+
+
+def failing_writer(records):
+    raise RuntimeError("write failed")
+
+
+def run_pipeline(adapter_cls, write_batch, transport=fake_transport):
+    """(완료 여부, 발생한 예외)"""
+    adapter = adapter_cls(transport=transport, max_pages=5)
+    pipeline = IngestionPipeline([adapter], write_batch, batch_size=50, queue_size=100)
+    outcome = {}
+
+    def target():
+        try:
+            outcome["report"] = pipeline.run()
+        except Exception as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(TIMEOUT)
+    return not thread.is_alive(), outcome.get("error")
+
+
+results = {}
+
+finished, error = run_pipeline(StaySearchAdapter, lambda records: len(records))
+results["정상 실행 (addr2 null 포함)"] = finished and error is None
+
+finished, error = run_pipeline(StaySearchAdapter, failing_writer)
+results["write 실패 시 RuntimeError로 종료"] = finished and isinstance(error, RuntimeError)
+
+finished, error = run_pipeline(FailingParseAdapter, lambda records: len(records))
+results["parse 실패 시 KeyError로 종료"] = finished and isinstance(error, KeyError)
+
+finished, error = run_pipeline(StaySearchAdapter, lambda records: len(records), failing_transport)
+results["API 호출 실패 시 ConnectionError로 종료"] = finished and isinstance(error, ConnectionError)
+
+# 녹화본 재생: 소스별 파싱 결과와, 두 소스에 모두 있는 롯데호텔 서울이 한 번만 저장되는지
+fixture_records = {}
+for adapter_cls in (StaySearchAdapter, HotelRegistryAdapter):
+    adapter = adapter_cls(transport=FixtureTransport(os.path.join(FIXTURES_DIR, adapter_cls.name)))
+    records = [adapter.parse(item) for items in adapter.fetch_pages() for item in items]
+    fixture_records[adapter_cls.name] = records
+    results[f"fixture 파싱 ({adapter_cls.name})"] = bool(records) and all(
+        r and r["name"] and r["content_id"] and r["address"] and r["latitude"] and r["longitude"]
+        for r in records
+    )
+results["fixture 주소 합치기 (addr1 + addr2)"] = (
+    fixture_records["search_stay2"][2]["address"] == "서울특별시 종로구 북촌로11길 12 (가회동)"
+)
+
+saved = []
+pipeline = IngestionPipeline(
+    [adapter_cls(transport=FixtureTransport(os.path.join(FIXTURES_DIR, adapter_cls.name)))
+     for adapter_cls in (StaySearchAdapter, HotelRegistryAdapter)],
+    lambda records: saved.extend(records) or len(records),
+)
+pipeline.run()
+results["fixture 소스 간 중복 제거 (5건 → 4건)"] = len(saved) == 4
+
+deduper = Deduper()
+branch = {"name": "스테이 호텔", "latitude": None, "longitude": None, "content_id": "a", "address": "서울 중구 1"}
+results["좌표 없는 같은 이름·다른 주소는 유지"] = not deduper.is_duplicate(branch) and not deduper.is_duplicate(
+    {**branch, "content_id": "b", "address": "부산 해운대구 2"}
+)
+results["좌표 없는 같은 이름·같은 주소는 제거"] = deduper.is_duplicate({**branch, "content_id": "c", "address": "서울중구 1"})
+
+print("="*60)
+for name, ok in results.items():
+    print(f"{'✅' if ok else '❌'} {name}")
+print("="*60)
+
+sys.exit(0 if all(results.values()) else 1)
@@ -0,0 +1,72 @@
+"""
+복제본 라우팅 확인 (SQLite 두 개로 primary / replica 흉내)
+
+    python check_replicas.py
+
+primary와 replica 파일에 서로 다른 데이터를 넣고
+1) 조회가 replica로 가는지, 2) pin_primary() 후 primary로 가는지,
+3) 동기화 완료 기록(sync_state) 후 다른 워커의 라우터도 primary로 가는지,
+4) replica가 죽으면 primary로 대체되는지 확인합니다.
+"""
+import os
+import shutil
+import sys
+import tempfile
+
+workdir = tempfile.mkdtemp()
+primary_path = os.path.join(workdir, "primary.db")
+replica_dir = os.path.join(workdir, "replica")
+os.makedirs(replica_dir)
+os.environ["DATABASE_URL"] = f"sqlite:///{primary_path}"
+os.environ["DATABASE_REPLICA_URLS"] = f"sqlite:///{os.path.join(replica_dir, 'replica.db')}"
+os.environ["REPLICA_HEALTH_INTERVAL"] = "0"
+
+from sqlalchemy.orm import Session
+
+from database import Base, ReplicaRouter, engine, router, run_read
+from models import Hotel
+from sync_data import record_sync_finished
+
+
+def seed(bind, name):
+    Base.metadata.create_all(bind)
+    with Session(bind) as db:
+        db.add(Hotel(name=name, content_id=name))
+        db.commit()
+
+
+def read_name():
+    return run_read(lambda db: db.query(Hotel.name).scalar())
+
+
+seed(engine, "primary")
+seed(router.replicas[0], "replica")
+
+results = {}
+
+results["replica 조회"] = read_name() == "replica"
+
+router.pin_primary(seconds=60)
+results["pin 후 primary 조회"] = read_name() == "primary"
+router.unpin()
+
+# 다른 워커(별도 라우터)는 in-process pin 없이 primary의 동기화 완료 기록만 보고 판단
+record_sync_finished(engine)
+other_worker = ReplicaRouter(engine, router.replicas, health_interval=0, pin_seconds=60)
+results["동기화 기록 후 다른 워커도 primary 조회"] = other_worker.read_engine() is engine
+expired = ReplicaRouter(engine, router.replicas, health_interval=0, pin_seconds=0)
+results["고정 시간이 지나면 replica 조회"] = expired.read_engine() is router.replicas[0]
+
+# replica 디렉터리를 지워 연결 불가 상태로 만듦
+router.replicas[0].dispose()
+shutil.rmtree(replica_dir)
+results["replica 장애 시 primary 대체"] = read_name() == "primary"
+results["replica 비정상 표시"] = router.status()["replicas"][0]["healthy"] is False
+
+print("="*60)
+for name, ok in results.items():
+    print(f"{'✅' if ok else '❌'} {name}")
+print("="*60)
+
+shutil.rmtree(workdir, ignore_errors=True)
+sys.exit(0 if all(results.values()) else 1)
@@ -0,0 +1,111 @@
+"""
+비동기 복제본 라우팅 확인 (packages/database + routers_backup/hotels.py, aiosqlite 두 개로 primary / replica 흉내)
+
+    pip install aiosqlite
+    python check_replicas_async.py
+
+실제 조회 엔드포인트(list_hotels, get_hotel)를 get_read_session 의존성으로 호출해
+1) 조회가 replica로 가는지, 2) 동기화 완료 기록(sync_state) 후 primary로 가는지,
+3) 고정 시간이 지나면 다시 replica로 가는지, 4) replica가 죽으면 요청이 실패하지 않고
+primary로 대체되는지 확인합니다.
+"""
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import types
+from contextlib import asynccontextmanager
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# backend/database.py 대신 packages/database의 database 패키지를 사용
+sys.path.insert(0, os.path.join(HERE, "..", "packages", "database"))
+
+# routers_backup/schemas_backup은 원래 routers/schemas 패키지 이름으로 서로를 import함
+schemas = types.ModuleType("schemas")
+schemas.__path__ = [os.path.join(HERE, "schemas_backup")]
+sys.modules["schemas"] = schemas
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from database import db_manager  # noqa: E402
+from routers_backup import hotels  # noqa: E402
+
+workdir = tempfile.mkdtemp()
+primary_path = os.path.join(workdir, "primary.db")
+replica_dir = os.path.join(workdir, "replica")
+os.makedirs(replica_dir)
+replica_path = os.path.join(replica_dir, "replica.db")
+
+
+def seed(path, name):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE hotels (id INTEGER PRIMARY KEY, name VARCHAR(255), address VARCHAR(511), price_per_night INTEGER)")
+    conn.execute("CREATE TABLE sync_state (name VARCHAR(50) PRIMARY KEY, finished_at DATETIME)")
+    conn.execute("INSERT INTO hotels (id, name) VALUES (1, ?)", (name,))
+    conn.commit()
+    conn.close()
+
+
+def record_sync(path):
+    conn = sqlite3.connect(path)
+    conn.execute("INSERT OR REPLACE INTO sync_state VALUES ('hotels', CURRENT_TIMESTAMP)")
+    conn.commit()
+    conn.close()
+
+
+seed(primary_path, "primary")
+seed(replica_path, "replica")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    db_manager.init(f"sqlite:///{primary_path}", replica_urls=[f"sqlite:///{replica_path}"], health_interval=0)
+    db_manager.engine.echo = False
+    yield
+    await db_manager.close()
+
+
+app = FastAPI(lifespan=lifespan)
+app.include_router(hotels.router)
+
+
+def list_name(client):
+    return client.get("/hotels").json()["items"][0]["name"]
+
+
+def detail(client):
+    return client.get("/hotels/1")
+
+
+results = {}
+
+with TestClient(app) as client:
+    results["replica 조회 (list_hotels)"] = list_name(client) == "replica"
+    results["replica 조회 (get_hotel)"] = detail(client).json()["name"] == "replica"
+
+    record_sync(primary_path)
+    db_manager._sync_checked_at = None  # 다음 조회 때 sync_state를 바로 다시 읽도록
+    results["동기화 기록 후 primary 조회"] = list_name(client) == "primary"
+
+    db_manager.pin_seconds = 0
+    db_manager._pinned_until = 0.0
+    db_manager._sync_checked_at = None
+    results["고정 시간이 지나면 replica 조회"] = list_name(client) == "replica"
+
+    # replica 파일을 지우고 풀을 비워 연결 불가 상태로 만듦 (상태 확인 주기는 길게 두어 세션 시작 시점에 감지)
+    db_manager.health_interval = 3600
+    shutil.rmtree(replica_dir)
+    client.portal.call(db_manager.replicas[0].kw["bind"].dispose)
+    response = detail(client)
+    results["replica 장애 시 primary 대체 (요청 성공)"] = response.status_code == 200 and response.json()["name"] == "primary"
+    results["replica 비정상 표시"] = list(db_manager._healthy.values()) == [False]
+
+print("="*60)
+for name, ok in results.items():
+    print(f"{'✅' if ok else '❌'} {name}")
+print("="*60)
+
+shutil.rmtree(workdir, ignore_errors=True)
+sys.exit(0 if all(results.values()) else 1)
@@ -0,0 +1,56 @@
+"""
+요청 병합 (single-flight)
+같은 키로 동시에 들어온 요청은 먼저 온 요청의 DB 조회 하나를 함께 기다렸다가 결과를 공유합니다.
+"""
+import threading
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        """key에 대해 진행 중인 호출이 있으면 그 결과를, 없으면 fn()을 실행한 결과를 반환"""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    def waiters(self, key):
+        """진행 중인 호출을 기다리는 요청 수 (없으면 0)"""
+        with self._lock:
+            call = self._calls.get(key)
+            return call.waiters if call else 0
+
+
+# /api/hotels 목록 조회용
+hotel_page_flight = SingleFlight()
@@ -0,0 +1,88 @@
+"""
+목록 응답 크기 줄이기
+- 일정 크기 이상 응답은 brotli(설치 시) 또는 gzip으로 압축
+- format=compact: 반복되는 문자열(설명·배지·카테고리 등)을 id로 바꾸고
+  문자열 표(strings)를 한 번만 보내는 열 기반(fields + rows) 응답
+"""
+from fastapi.middleware.gzip import GZipMiddleware
+
+# 이 크기(bytes) 미만 응답은 압축하지 않음 (압축 비용 > 절감 효과)
+MIN_COMPRESS_SIZE = 1024
+
+IMAGE_URL_TEMPLATE = "https://loremflickr.com/800/600/mansion,villa,hotel/all?lock={id}"
+
+COMPACT_FIELDS = [
+    "id", "name", "address", "category", "price", "rating", "reviews",
+    "date_range", "stay_nights", "description", "urgency", "badges",
+    "hotel_type", "max_guests", "bedrooms", "beds", "bathrooms",
+]
+
+# 문자열 표의 id로 바꿔 보낼 필드 (badges는 id 리스트)
+DICTIONARY_FIELDS = {"category", "description", "urgency", "hotel_type", "date_range"}
+
+
+def add_compression(app, minimum_size=MIN_COMPRESS_SIZE):
+    """brotli-asgi가 있으면 br(+gzip 대체), 없으면 gzip 미들웨어 등록"""
+    try:
+        from brotli_asgi import BrotliMiddleware
+    except ImportError:
+        app.add_middleware(GZipMiddleware, minimum_size=minimum_size)
+        return "gzip"
+
+    app.add_middleware(BrotliMiddleware, minimum_size=minimum_size, gzip_fallback=True)
+    return "br"
+
+
+def encode_compact(hotels):
+    """
+    목록 행을 compact 형식으로 변환
+    - hotels: [[COMPACT_FIELDS 순서의 값], ...]
+    - image_url은 image_url_template의 {id}로 복원, urgency_message는 urgency와 같아 생략
+    """
+    strings = []
+    index = {}
+
+    def ref(value):
+        if value is None:
+            return None
+        if value not in index:
+            index[value] = len(strings)
+            strings.append(value)
+        return index[value]
+
+    rows = []
+    for hotel in hotels:
+        row = []
+        for field in COMPACT_FIELDS:
+            value = hotel[field]
+            if field in DICTIONARY_FIELDS:
+                value = ref(value)
+            elif field == "badges":
+                value = [ref(badge) for badge in value]
+            row.append(value)
+        rows.append(row)
+
+    return {
+        "format": "compact",
+        "fields": COMPACT_FIELDS,
+        "dictionary_fields": sorted(DICTIONARY_FIELDS | {"badges"}),
+        "strings": strings,
+        "image_url_template": IMAGE_URL_TEMPLATE,
+        "hotels": rows,
+    }
+
+
+def decode_compact(payload):
+    """encode_compact의 역변환 (클라이언트 구현 참고용)"""
+    strings = payload["strings"]
+    hotels = []
+    for row in payload["hotels"]:
+        hotel = dict(zip(payload["fields"], row))
+        for field in DICTIONARY_FIELDS:
+            if hotel[field] is not None:
+                hotel[field] = strings[hotel[field]]
+        hotel["badges"] = [strings[i] for i in hotel["badges"]]
+        hotel["urgency_message"] = hotel["urgency"]
+        hotel["image_url"] = payload["image_url_template"].format(id=hotel["id"])
+        hotels.append(hotel)
+    return hotels
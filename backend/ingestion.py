@@ -0,0 +1,453 @@
+"""
+다중 소스 숙박 데이터 수집 파이프라인
+
+소스마다 어댑터(페이지 단위 스트리밍 + 전용 파서)를 두고,
+fetch → normalize → dedupe → write 단계를 스레드로 동시에 실행합니다.
+각 단계의 처리량은 StageMetrics로 집계됩니다.
+"""
+import hashlib
+import json
+import os
+import queue
+import re
+import threading
+import time
+from dataclasses import dataclass
+
+# 한국관광공사 표준 분류 코드 (전국호텔현황은 전부 관광호텔로 분류)
+HOTEL_CATEGORY = "B02010100"
+
+# 같은 숙소로 볼 좌표 허용 오차 (위경도 약 0.0015도 ≈ 150m)
+COORD_TOLERANCE = 0.0015
+
+_SENTINEL = object()
+
+
+# ------------------------------------------------------------
+# Transport: HTTP 호출 / 녹화 / 녹화본 재생
+# ------------------------------------------------------------
+class HttpTransport:
+    """공공데이터포털 API를 실제로 호출"""
+
+    def __init__(self, timeout=10):
+        self.timeout = timeout
+
+    def __call__(self, url, params):
+        import requests
+
+        response = requests.get(url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+
+class RecordingTransport:
+    """실제 응답을 fixture 디렉터리에 page_{n}.json으로 저장"""
+
+    def __init__(self, directory, inner=None):
+        self.directory = directory
+        self.inner = inner or HttpTransport()
+
+    def __call__(self, url, params):
+        data = self.inner(url, params)
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"page_{params.get('pageNo', 1)}.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        return data
+
+
+class FixtureTransport:
+    """녹화된 page_{n}.json을 재생 (네트워크 없이 어댑터 확인용)"""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def __call__(self, url, params):
+        path = os.path.join(self.directory, f"page_{params.get('pageNo', 1)}.json")
+        if not os.path.exists(path):
+            return {}
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+
+# ------------------------------------------------------------
+# Source adapters
+# ------------------------------------------------------------
+class SourceAdapter:
+    """
+    소스 어댑터 기본 클래스
+    - fetch_pages(): 페이지 단위로 원본 item 리스트를 스트리밍
+    - parse(item): 원본 item → hotels 테이블 컬럼 dict (건너뛸 경우 None)
+    """
+
+    name = "base"
+    base_url = ""
+
+    def __init__(self, service_key=None, transport=None, num_of_rows=100, max_pages=5):
+        self.service_key = service_key
+        self.transport = transport or HttpTransport()
+        self.num_of_rows = num_of_rows
+        self.max_pages = max_pages
+
+    def build_params(self, page_no):
+        raise NotImplementedError
+
+    def extract_items(self, data):
+        """공공데이터포털 공통 응답(response.body.items)에서 item 리스트 추출"""
+        body = (data.get("response") or {}).get("body") or {}
+        items = body.get("items")
+        if not items:
+            return []
+        if isinstance(items, dict):
+            items = items.get("item") or []
+        # 결과가 1건이면 리스트가 아닌 dict로 오는 경우가 있음
+        if isinstance(items, dict):
+            items = [items]
+        return items
+
+    def fetch_pages(self):
+        """API 호출 실패는 삼키지 않고 그대로 발생 (파이프라인 fetch 단계 실패로 처리)"""
+        for page_no in range(1, self.max_pages + 1):
+            try:
+                data = self.transport(self.base_url, self.build_params(page_no))
+            except Exception as e:
+                print(f"❌ [{self.name}] API 호출 실패 (페이지: {page_no}): {e}")
+                raise
+
+            items = self.extract_items(data or {})
+            if not items:
+                return
+            yield items
+
+    def parse(self, item):
+        raise NotImplementedError
+
+
+class StaySearchAdapter(SourceAdapter):
+    """한국관광공사 KorService2 searchStay2 (숙박정보)"""
+
+    name = "search_stay2"
+    base_url = "http://apis.data.go.kr/B551011/KorService2/searchStay2"
+
+    def build_params(self, page_no):
+        return {
+            "serviceKey": self.service_key,
+            "numOfRows": self.num_of_rows,
+            "pageNo": page_no,
+            "MobileOS": "ETC",
+            "MobileApp": "StayWise",
+            "_type": "json",
+        }
+
+    def parse(self, item):
+        content_id = item.get("contentid")
+        name = (item.get("title") or "").strip()
+        if not content_id or not name:
+            return None
+
+        return {
+            "name": name,
+            "address": ((item.get("addr1") or "") + " " + (item.get("addr2") or "")).strip(),
+            "category": item.get("cat3") or "기타",
+            "phone": item.get("tel") or "",
+            "homepage": item.get("homepage") or "",
+            "latitude": _to_float(item.get("mapy")),
+            "longitude": _to_float(item.get("mapx")),
+            "description": item.get("overview") or "",
+            "content_id": str(content_id),
+        }
+
+
+class HotelRegistryAdapter(SourceAdapter):
+    """전국호텔현황 표준데이터 (tn_pubr_public_htel_info_api)"""
+
+    name = "hotel_registry"
+    base_url = "http://api.data.go.kr/openapi/tn_pubr_public_htel_info_api"
+
+    def build_params(self, page_no):
+        return {
+            "serviceKey": self.service_key,
+            "pageNo": page_no,
+            "numOfRows": self.num_of_rows,
+            "type": "json",
+        }
+
+    def parse(self, item):
+        name = _first(item, "htlNm", "bsshNm", "bplcNm").strip()
+        if not name:
+            return None
+        address = _first(item, "rdnmadr", "lnmadr").strip()
+
+        # 표준데이터에는 contentid가 없으므로 이름+주소로 안정적인 ID 생성
+        digest = hashlib.sha1(f"{name}|{address}".encode("utf-8")).hexdigest()[:20]
+
+        return {
+            "name": name,
+            "address": address,
+            "category": HOTEL_CATEGORY,
+            "phone": _first(item, "phoneNumber", "telno"),
+            "homepage": _first(item, "homepageUrl", "homepage"),
+            "latitude": _to_float(item.get("latitude")),
+            "longitude": _to_float(item.get("longitude")),
+            "description": "",
+            "content_id": f"htel-{digest}",
+        }
+
+
+ADAPTERS = {
+    StaySearchAdapter.name: StaySearchAdapter,
+    HotelRegistryAdapter.name: HotelRegistryAdapter,
+}
+
+
+def _first(item, *keys):
+    for key in keys:
+        value = item.get(key)
+        if value:
+            return str(value)
+    return ""
+
+
+def _to_float(value):
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number or None
+
+
+# ------------------------------------------------------------
+# Dedupe
+# ------------------------------------------------------------
+def normalize_name(name):
+    """공백·특수문자 제거 후 소문자로 비교 (예: '서울 호텔(본관)' == '서울호텔본관')"""
+    return re.sub(r"[\W_]+", "", name or "").lower()
+
+
+class Deduper:
+    """
+    이름 + 좌표(약 150m 이내)로 소스 간 중복 숙소 제거
+    좌표가 없는 쪽이 있으면 정규화한 주소가 같을 때만 중복으로 봄
+    (이름만 같은 체인 지점 등을 합치지 않도록)
+    """
+
+    def __init__(self, tolerance=COORD_TOLERANCE):
+        self.tolerance = tolerance
+        self._seen = {}
+        self._content_ids = set()
+
+    def seed(self, rows):
+        """이미 DB에 있는 (name, address, latitude, longitude, content_id)로 초기화"""
+        for name, address, latitude, longitude, content_id in rows:
+            self.is_duplicate({
+                "name": name,
+                "address": address,
+                "latitude": latitude,
+                "longitude": longitude,
+                "content_id": content_id,
+            })
+
+    def is_duplicate(self, record):
+        if record["content_id"] in self._content_ids:
+            return True
+
+        key = normalize_name(record["name"])
+        place = (record.get("latitude"), record.get("longitude"), normalize_name(record.get("address")))
+        for seen in self._seen.get(key, []):
+            if self._same_place(seen, place):
+                return True
+
+        self._seen.setdefault(key, []).append(place)
+        self._content_ids.add(record["content_id"])
+        return False
+
+    def _same_place(self, a, b):
+        # place = (위도, 경도, 정규화한 주소) — 좌표가 없으면 주소로, 주소도 없으면 다른 숙소로 취급
+        if None in a[:2] or None in b[:2]:
+            return bool(a[2]) and a[2] == b[2]
+        return (
+            abs(a[0] - b[0]) <= self.tolerance
+            and abs(a[1] - b[1]) <= self.tolerance
+        )
+
+
+# ------------------------------------------------------------
+# Pipeline
+# ------------------------------------------------------------
+@dataclass
+class StageMetrics:
+    name: str
+    items: int = 0
+    dropped: int = 0
+    started: float = 0.0
+    finished: float = 0.0
+
+    @property
+    def elapsed(self):
+        return max(self.finished - self.started, 0.0)
+
+    @property
+    def rate(self):
+        return self.items / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self):
+        return {
+            "items": self.items,
+            "dropped": self.dropped,
+            "seconds": round(self.elapsed, 3),
+            "items_per_sec": round(self.rate, 1),
+        }
+
+
+class IngestionPipeline:
+    """
+    어댑터별 fetch 스레드 → normalize → dedupe → write 스레드
+    단계 사이는 bounded queue로 연결되어 느린 단계가 앞 단계를 자연스럽게 늦춥니다.
+    write_batch(records)는 저장한 개수를 반환해야 합니다.
+    한 단계라도 실패하면 fetch는 멈추고, 나머지 단계는 입력 큐를 끝까지 비우기만 한 뒤
+    run()이 첫 번째 예외를 다시 발생시킵니다. (어느 단계도 put()에서 막히지 않음)
+    """
+
+    def __init__(self, adapters, write_batch, deduper=None, batch_size=200, queue_size=1000):
+        self.adapters = adapters
+        self.write_batch = write_batch
+        self.deduper = deduper or Deduper()
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+        self.metrics = {
+            stage: StageMetrics(stage)
+            for stage in ("fetch", "normalize", "dedupe", "write")
+        }
+        self.saved = 0
+        self._errors = []
+        self._failed = threading.Event()
+
+    def run(self):
+        raw_q = queue.Queue(self.queue_size)
+        normalized_q = queue.Queue(self.queue_size)
+        write_q = queue.Queue(max(self.queue_size // self.batch_size, 2))
+
+        fetchers = [
+            threading.Thread(target=self._fetch, args=(adapter, raw_q), daemon=True)
+            for adapter in self.adapters
+        ]
+        stages = [
+            threading.Thread(target=self._normalize, args=(raw_q, normalized_q, len(fetchers)), daemon=True),
+            threading.Thread(target=self._dedupe, args=(normalized_q, write_q), daemon=True),
+            threading.Thread(target=self._write, args=(write_q,), daemon=True),
+        ]
+
+        for thread in fetchers + stages:
+            thread.start()
+        for thread in fetchers + stages:
+            thread.join()
+
+        if self._errors:
+            raise self._errors[0]
+        return self.report()
+
+    def report(self):
+        return {name: m.as_dict() for name, m in self.metrics.items()}
+
+    def _guard(self, stage, fn):
+        metrics = self.metrics[stage]
+        metrics.started = metrics.started or time.perf_counter()
+        try:
+            fn()
+        except Exception as e:
+            self._errors.append(e)
+            self._failed.set()
+            print(f"❌ [ingestion] {stage} 단계 실패: {type(e).__name__}: {e}")
+        finally:
+            metrics.finished = time.perf_counter()
+
+    def _consume(self, in_q, producers=1):
+        """앞 단계 sentinel이 producers개 올 때까지 꺼냄 (실패 이후 항목은 버리고 큐만 비움)"""
+        remaining = producers
+        while remaining:
+            entry = in_q.get()
+            if entry is _SENTINEL:
+                remaining -= 1
+                continue
+            if self._failed.is_set():
+                continue
+            yield entry
+
+    def _fetch(self, adapter, out_q):
+        def work():
+            for items in adapter.fetch_pages():
+                if self._failed.is_set():
+                    return
+                for item in items:
+                    out_q.put((adapter, item))
+                self.metrics["fetch"].items += len(items)
+
+        try:
+            self._guard("fetch", work)
+        finally:
+            out_q.put(_SENTINEL)
+
+    def _normalize(self, in_q, out_q, producers):
+        entries = self._consume(in_q, producers)
+
+        def work():
+            for adapter, item in entries:
+                record = adapter.parse(item)
+                if record is None:
+                    self.metrics["normalize"].dropped += 1
+                    continue
+                self.metrics["normalize"].items += 1
+                out_q.put(record)
+
+        try:
+            self._guard("normalize", work)
+            for _ in entries:  # 실패했다면 남은 입력을 비움
+                pass
+        finally:
+            out_q.put(_SENTINEL)
+
+    def _dedupe(self, in_q, out_q):
+        records = self._consume(in_q)
+
+        def work():
+            batch = []
+            for record in records:
+                if self.deduper.is_duplicate(record):
+                    self.metrics["dedupe"].dropped += 1
+                    continue
+                self.metrics["dedupe"].items += 1
+                batch.append(record)
+                if len(batch) >= self.batch_size:
+                    out_q.put(batch)
+                    batch = []
+            if batch and not self._failed.is_set():
+                out_q.put(batch)
+
+        try:
+            self._guard("dedupe", work)
+            for _ in records:
+                pass
+        finally:
+            out_q.put(_SENTINEL)
+
+    def _write(self, in_q):
+        batches = self._consume(in_q)
+
+        def work():
+            for batch in batches:
+                self.saved += self.write_batch(batch)
+                self.metrics["write"].items += len(batch)
+
+        self._guard("write", work)
+        for _ in batches:
+            pass
+
+
+def print_report(report):
+    print("📈 단계별 처리량")
+    for stage, m in report.items():
+        print(
+            f"  - {stage:<9} {m['items']:>6}건 "
+            f"(제외 {m['dropped']}건) {m['seconds']:>7.3f}s "
+            f"{m['items_per_sec']:>9.1f}건/s"
+        )
@@ -0,0 +1,597 @@
+"""
+백그라운드 작업 실행기
+
+동기화·통계 갱신·검색 인덱스 재생성·캐시 워밍업을 요청 처리 경로 밖에서 실행합니다.
+- JobRunner: 스레드/프로세스 풀에서 작업 실행
+- JobStore: 작업 상태·진행률을 DB(jobs 테이블)에 기록 → 어느 워커에서든 같은 결과로 조회
+- Scheduler: 주기 작업 제출
+- exclusive_lock: 여러 워커가 동시에 동기화하지 않도록 잠금
+  (PostgreSQL은 advisory lock, 그 외에는 파일 잠금)
+"""
+import json
+import multiprocessing
+import os
+import socket
+import tempfile
+import threading
+import time
+import uuid
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+from cache import listing_cache, stats_cache
+
+# 워밍업 대상 카테고리 (None = 전체)
+WARMUP_CATEGORIES = [
+    None,
+    "B02010100",  # 관광호텔
+    "B02010500",  # 콘도미니엄(리조트)
+    "B02010700",  # 펜션
+    "B02010900",  # 모텔
+    "B02011100",  # 게스트하우스
+    "B02011600",  # 한옥
+    "A02030100",  # 야영장(캠핑)
+]
+WARMUP_PAGE_SIZE = 20
+
+# 진행률을 DB에 기록하는 최소 간격(초)과 작업 기록 보관 기간(일)
+PROGRESS_SAVE_INTERVAL = 1.0
+JOB_HISTORY_DAYS = 7
+
+# 스케줄러의 sync 제출은 마지막 동기화가 주기 × 이 비율보다 최근이면 건너뜀
+SYNC_FRESHNESS_RATIO = 0.8
+
+
+class JobSkipped(Exception):
+    """다른 워커가 같은 작업을 실행 중이라 건너뜀"""
+
+
+# ------------------------------------------------------------
+# 단일 실행 잠금
+# ------------------------------------------------------------
+@contextmanager
+def exclusive_lock(name, engine=None):
+    if engine is None:
+        from database import get_engine
+
+        engine = get_engine()
+
+    if engine.dialect.name == "postgresql":
+        from sqlalchemy import text
+
+        key = zlib.crc32(f"staywise:{name}".encode())
+        with engine.connect() as conn:
+            acquired = conn.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": key}).scalar()
+            if not acquired:
+                raise JobSkipped(f"'{name}' 작업이 다른 워커에서 실행 중입니다")
+            try:
+                yield
+            finally:
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+        return
+
+    with _file_lock(os.path.join(tempfile.gettempdir(), f"staywise-{name}.lock"), name):
+        yield
+
+
+@contextmanager
+def _file_lock(path, name):
+    import fcntl
+
+    with open(path, "w") as f:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise JobSkipped(f"'{name}' 작업이 다른 워커에서 실행 중입니다")
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+# ------------------------------------------------------------
+# 작업 함수
+# 프로세스 풀에서도 실행될 수 있도록 모듈 최상위 함수로 두고,
+# 캐시처럼 API 프로세스에 반영해야 하는 부분은 apply 함수에서 처리합니다.
+# ------------------------------------------------------------
+def _no_progress(**info):
+    pass
+
+
+def sync_job(progress, max_age=None):
+    """
+    공공데이터 동기화
+    max_age(초)를 주면 마지막 동기화(sync_state)가 그보다 최근일 때 건너뜀
+    (스케줄러 제출용 — 배포·재시작·워커 교체마다 전체 동기화가 다시 돌지 않도록)
+    """
+    from database import get_engine
+    from sync_data import last_sync_age, run_sync
+
+    with exclusive_lock("sync"):
+        if max_age:
+            age = last_sync_age(get_engine())
+            if age is not None and age < max_age:
+                raise JobSkipped(f"마지막 동기화가 {age / 60:.0f}분 전이라 건너뜁니다")
+        return run_sync(progress=progress)
+
+
+def refresh_stats_job(progress):
+    from database import run_read
+    from queries import fetch_statistics
+
+    return run_read(fetch_statistics)
+
+
+def rebuild_search_index_job(progress):
+    """
+    이름·주소 부분 검색(ilike)과 카테고리 필터용 인덱스 생성
+    서비스 중인 primary에서 실행되므로 PostgreSQL은 autocommit 연결에서 CREATE INDEX CONCURRENTLY로
+    쓰기를 막지 않고 만들고(REINDEX 없음), 문장마다 따로 커밋해 한 단계 실패가 앞 단계를 되돌리지 않음
+    pg_trgm 확장을 만들 권한이 없고 설치되어 있지도 않으면 trigram 인덱스만 건너뜀
+    """
+    from sqlalchemy import text
+    from sqlalchemy.exc import DBAPIError
+
+    from database import get_engine
+
+    engine = get_engine()
+    if engine.dialect.name != "postgresql":
+        with exclusive_lock("search_index"):
+            with engine.begin() as conn:
+                conn.execute(text("CREATE INDEX IF NOT EXISTS ix_hotels_category ON hotels (category)"))
+        progress(done=1, total=1)
+        return {"indexes": ["ix_hotels_category"], "trigram": False}
+
+    indexes = {"ix_hotels_category": "hotels (category)"}
+    trigram_indexes = {
+        "ix_hotels_name_trgm": "hotels USING gin (name gin_trgm_ops)",
+        "ix_hotels_address_trgm": "hotels USING gin (address gin_trgm_ops)",
+    }
+
+    with exclusive_lock("search_index"):
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            try:
+                conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+            except DBAPIError as e:
+                print(f"⚠️ [jobs] pg_trgm 확장 생성 실패 (이미 설치되어 있지 않으면 trigram 인덱스 생략): {e.orig}")
+            trigram = conn.execute(
+                text("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+            ).scalar() is not None
+            if trigram:
+                indexes.update(trigram_indexes)
+
+            total = len(indexes) + 1
+            for i, (name, definition) in enumerate(indexes.items(), start=1):
+                # 이전에 중단된 CONCURRENTLY 빌드가 남긴 INVALID 인덱스는 IF NOT EXISTS에 걸리므로 먼저 제거
+                invalid = conn.execute(text(
+                    "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+                    "WHERE c.relname = :name AND NOT i.indisvalid"
+                ), {"name": name}).scalar()
+                if invalid:
+                    conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {name}"))
+                conn.execute(text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {definition}"))
+                progress(done=i, total=total)
+
+            conn.execute(text("ANALYZE hotels"))
+            progress(done=total, total=total)
+
+    return {"indexes": list(indexes), "trigram": trigram}
+
+
+def warm_cache_job(progress):
+    """카테고리별 첫 페이지 DB 조회 결과를 미리 계산"""
+    from database import run_read
+    from queries import fetch_hotel_page, listing_key
+
+    pages = {}
+    for i, category in enumerate(WARMUP_CATEGORIES, start=1):
+        key = listing_key(1, WARMUP_PAGE_SIZE, category)
+        pages[key] = run_read(lambda db: fetch_hotel_page(db, *key))
+        progress(done=i, total=len(WARMUP_CATEGORIES))
+    return pages
+
+
+def similar_job(progress):
+    """
+    비슷한 숙소 top-k 전체 재계산 (NumPy)
+    마지막 계산이 SIMILAR_MAX_AGE_HOURS보다 최근이면 건너뜀
+    (워커 부팅·재시작마다 제출되어도 하루 한 번만 계산)
+    """
+    from database import get_engine
+    from similar import last_computed_at, precompute_similar
+
+    engine = get_engine()
+    with exclusive_lock("similar"):
+        computed_at = last_computed_at(engine)
+        max_age = timedelta(hours=float(os.getenv("SIMILAR_MAX_AGE_HOURS", "20")))
+        if computed_at is not None and datetime.now() - computed_at < max_age:
+            raise JobSkipped(f"비슷한 숙소가 이미 계산되어 있습니다 ({computed_at:%Y-%m-%d %H:%M})")
+        return precompute_similar(engine, progress=progress)
+
+
+def _apply_sync(runner, result):
+    from database import get_router
+
+    # run_sync가 primary에 기록한 완료 시각을 바로 읽어 이 워커도 즉시 primary로 고정
+    # (다른 워커는 REPLICA_SYNC_CHECK_SECONDS 안에 같은 값을 읽음)
+    get_router().refresh_sync_pin(force=True)
+
+    # 새 데이터가 들어왔으므로 캐시를 비우고 다시 채움
+    listing_cache.clear()
+    runner.submit("stats_refresh")
+    runner.submit("cache_warmup")
+
+
+def _apply_stats(runner, result):
+    stats_cache.set("stats", result)
+
+
+def _apply_warmup(runner, result):
+    for key, page in result.items():
+        listing_cache.set(key, page)
+
+
+@dataclass
+class JobSpec:
+    fn: Callable
+    apply: Optional[Callable] = None
+    # True면 JOB_WORKER_MODE와 관계없이 매번 새 프로세스(spawn)에서 실행하고 끝나면 종료
+    # (메모리를 많이 쓰는 작업이 API 워커의 RSS를 키우지 않도록)
+    isolated: bool = False
+
+
+JOBS = {
+    "sync": JobSpec(sync_job, _apply_sync),
+    "stats_refresh": JobSpec(refresh_stats_job, _apply_stats),
+    "search_index": JobSpec(rebuild_search_index_job),
+    "cache_warmup": JobSpec(warm_cache_job, _apply_warmup),
+    "similar": JobSpec(similar_job, isolated=True),
+}
+
+
+# ------------------------------------------------------------
+# 실행기
+# ------------------------------------------------------------
+@dataclass
+class Job:
+    name: str
+    id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    status: str = "queued"  # queued | running | succeeded | failed | skipped
+    progress: dict = field(default_factory=dict)
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    @property
+    def active(self):
+        return self.status in ("queued", "running")
+
+    def as_dict(self):
+        return {
+            "id": self.id,
+            "name": self.name,
+            "status": self.status,
+            "progress": self.progress,
+            "result": self.result if self.name != "cache_warmup" else None,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+class JobStore:
+    """
+    작업 상태를 primary DB의 jobs 테이블에 기록·조회
+    기록 실패는 작업 실행에 영향을 주지 않도록 경고만 출력합니다.
+    """
+
+    def __init__(self, engine=None):
+        self._engine = engine
+        self._ready = False
+        self._lock = threading.Lock()
+        self.worker = f"{socket.gethostname()}:{os.getpid()}"
+
+    @property
+    def engine(self):
+        if self._engine is None:
+            from database import get_engine
+
+            self._engine = get_engine()
+        return self._engine
+
+    def _ensure_table(self):
+        if not self._ready:
+            from models import JobRecord
+
+            with self._lock:
+                if not self._ready:
+                    JobRecord.__table__.create(self.engine, checkfirst=True)
+                    self._ready = True
+
+    def save(self, job):
+        from sqlalchemy.orm import Session
+
+        from models import JobRecord
+
+        row = JobRecord(
+            id=job.id,
+            name=job.name,
+            status=job.status,
+            progress=dict(job.progress),
+            result=_json_safe(job.as_dict()["result"]),
+            error=job.error,
+            worker=self.worker,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+        )
+        try:
+            self._ensure_table()
+            with Session(self.engine) as db:
+                db.merge(row)
+                db.commit()
+        except Exception as e:
+            print(f"⚠️ [jobs] 작업 상태 기록 실패 ({job.name} {job.status}): {e}")
+
+    def get(self, job_id):
+        from sqlalchemy.orm import Session
+
+        from models import JobRecord
+
+        self._ensure_table()
+        with Session(self.engine) as db:
+            row = db.get(JobRecord, job_id)
+            return _record_as_dict(row) if row else None
+
+    def list(self, limit=100):
+        from sqlalchemy.orm import Session
+
+        from models import JobRecord
+
+        self._ensure_table()
+        with Session(self.engine) as db:
+            rows = db.query(JobRecord).order_by(JobRecord.created_at.desc()).limit(limit).all()
+            return [_record_as_dict(row) for row in rows]
+
+    def prune(self, days=JOB_HISTORY_DAYS):
+        from sqlalchemy import delete
+
+        from models import JobRecord
+
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(delete(JobRecord).where(JobRecord.created_at < datetime.now() - timedelta(days=days)))
+        except Exception as e:
+            print(f"⚠️ [jobs] 오래된 작업 기록 삭제 실패: {e}")
+
+
+def _json_safe(value):
+    # 작업 결과에 datetime 등 JSON으로 바로 저장할 수 없는 값이 있으면 문자열로
+    return json.loads(json.dumps(value, default=str)) if value is not None else None
+
+
+def _record_as_dict(row):
+    return {
+        "id": row.id,
+        "name": row.name,
+        "status": row.status,
+        "progress": row.progress or {},
+        "result": row.result,
+        "error": row.error,
+        "worker": row.worker,
+        "created_at": row.created_at.isoformat(),
+        "started_at": row.started_at.isoformat() if row.started_at else None,
+        "finished_at": row.finished_at.isoformat() if row.finished_at else None,
+    }
+
+
+class JobRunner:
+    """
+    작업 실행기
+    - mode="thread": 진행률이 실시간으로 갱신됨 (기본)
+    - mode="process": CPU를 많이 쓰는 작업을 별도 프로세스에서 실행 (진행률은 완료 시점에만 갱신)
+      자식 프로세스는 fork가 아닌 spawn으로 만들어 API 워커의 스레드 잠금·DB 커넥션 풀을 물려받지 않음
+    - JobSpec.isolated 작업은 모드와 관계없이 실행마다 새 spawn 프로세스에서 돌고, 끝나면 프로세스가 종료됨
+    어느 모드든 같은 수의 스레드가 작업을 하나씩 맡으므로, 실제로 시작되기 전까지는 queued 상태입니다.
+    같은 이름의 작업이 이 프로세스에서 아직 대기 중이면 새로 만들지 않고 기존 작업을 돌려줍니다.
+    (이미 실행 중인 작업은 결과가 오래되었을 수 있으므로 새로 제출)
+    상태 변화와 진행률은 store(JobStore)에 기록되며, get()/list()는 store에서 조회합니다.
+    """
+
+    def __init__(self, max_workers=2, mode="thread", history=100, store=None):
+        self.mode = mode
+        self.store = store or JobStore()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._process_pool = None
+        if mode == "process":
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        self._jobs = {}
+        self._history = history
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            max_workers=int(os.getenv("JOB_WORKERS", "2")),
+            mode=os.getenv("JOB_WORKER_MODE", "thread"),
+        )
+
+    def submit(self, name, **options):
+        """options는 작업 함수에 키워드 인자로 전달 (예: sync의 max_age)"""
+        if name not in JOBS:
+            raise KeyError(name)
+
+        with self._lock:
+            for job in self._jobs.values():
+                if job.name == name and job.status == "queued":
+                    return job
+            job = Job(name=name)
+            self._jobs[job.id] = job
+            self._trim()
+
+        self.store.save(job)
+        spec = JOBS[name]
+        future = self._pool.submit(self._run, job, spec, options)
+        future.add_done_callback(lambda f: self._finish(job, spec, f))
+        return job
+
+    def get(self, job_id):
+        """작업 상태 dict (다른 워커가 실행한 작업 포함, 없으면 None)"""
+        return self.store.get(job_id)
+
+    def list(self):
+        """최근 작업 상태 dict 목록 (모든 워커)"""
+        return self.store.list(limit=self._history)
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        if self._process_pool:
+            self._process_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job, spec, options):
+        fn = spec.fn
+        job.status = "running"
+        job.started_at = datetime.now()
+        self.store.save(job)
+        if spec.isolated:
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                return pool.submit(fn, _no_progress, **options).result()
+        if self._process_pool:
+            return self._process_pool.submit(fn, _no_progress, **options).result()
+
+        last_saved = [time.monotonic()]
+
+        def progress(**info):
+            job.progress.update(info)
+            if time.monotonic() - last_saved[0] >= PROGRESS_SAVE_INTERVAL:
+                last_saved[0] = time.monotonic()
+                self.store.save(job)
+
+        return fn(progress, **options)
+
+    def _finish(self, job, spec, future):
+        job.finished_at = datetime.now()
+        try:
+            job.result = future.result()
+        except JobSkipped as e:
+            job.status = "skipped"
+            job.error = str(e)
+            self.store.save(job)
+            return
+        except Exception as e:
+            job.status = "failed"
+            job.error = f"{type(e).__name__}: {e}"
+            print(f"❌ [jobs] {job.name} 실패: {job.error}")
+            self.store.save(job)
+            return
+
+        job.status = "succeeded"
+        self.store.save(job)
+        if spec.apply:
+            try:
+                spec.apply(self, job.result)
+            except Exception as e:
+                print(f"⚠️ [jobs] {job.name} 결과 반영 실패: {e}")
+
+    def _trim(self):
+        finished = [j for j in self._jobs.values() if not j.active]
+        for job in sorted(finished, key=lambda j: j.created_at)[:max(len(self._jobs) - self._history, 0)]:
+            del self._jobs[job.id]
+
+
+class Scheduler(threading.Thread):
+    """
+    작업 제출
+    - intervals {작업 이름: 주기(초)}: 시작 직후 한 번 + 주기마다 (0 이하면 비활성)
+      sync는 max_age를 함께 넘겨, 다른 프로세스가 최근에 동기화했으면 작업 쪽에서 건너뜀
+    - daily {작업 이름: "HH:MM"}: 시작 직후 한 번 + 매일 그 시각 (서버 로컬 시간, 빈 값이면 비활성)
+      시작 직후 실행은 결과가 없을 때를 위한 것이며, 최신이면 작업 쪽에서 건너뜀
+    """
+
+    def __init__(self, runner, intervals, daily=None):
+        super().__init__(name="staywise-scheduler", daemon=True)
+        self.runner = runner
+        self.intervals = {name: sec for name, sec in intervals.items() if sec > 0}
+        self.daily = {name: parse_time_of_day(at) for name, at in (daily or {}).items() if at}
+        self._stop = threading.Event()
+
+    @classmethod
+    def from_env(cls, runner):
+        return cls(
+            runner,
+            {
+                "sync": float(os.getenv("SYNC_INTERVAL_MINUTES", "0")) * 60,
+                "stats_refresh": float(os.getenv("STATS_REFRESH_MINUTES", "10")) * 60,
+                "cache_warmup": float(os.getenv("CACHE_WARMUP_MINUTES", "5")) * 60,
+            },
+            daily={
+                "similar": os.getenv("SIMILAR_DAILY_AT", "03:00"),
+            },
+        )
+
+    def _delay(self, name):
+        if name in self.intervals:
+            return self.intervals[name]
+        return seconds_until(*self.daily[name])
+
+    def _options(self, name):
+        if name == "sync":
+            # 주기보다 조금 짧게: 동기화에 걸린 시간만큼 다음 주기에는 경과 시간이 주기보다 짧음
+            return {"max_age": self.intervals[name] * SYNC_FRESHNESS_RATIO}
+        return {}
+
+    def run(self):
+        self.runner.store.prune()
+        next_run = {name: time.monotonic() for name in [*self.intervals, *self.daily]}
+        while not self._stop.is_set():
+            now = time.monotonic()
+            for name in next_run:
+                if now >= next_run[name]:
+                    self.runner.submit(name, **self._options(name))
+                    next_run[name] = now + self._delay(name)
+            wait = min(next_run.values(), default=now + 60) - time.monotonic()
+            self._stop.wait(max(wait, 1))
+
+    def stop(self):
+        self._stop.set()
+
+
+def parse_time_of_day(value):
+    """'HH:MM' → (시, 분)"""
+    hour, minute = (int(part) for part in value.split(":"))
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        raise ValueError(f"HH:MM 형식이 아닙니다: {value}")
+    return hour, minute
+
+
+def seconds_until(hour, minute, now=None):
+    """다음 hour:minute(로컬 시간)까지 남은 초"""
+    now = now or datetime.now()
+    target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if target <= now:
+        target += timedelta(days=1)
+    return (target - now).total_seconds()
+
+
+_runner = None
+_runner_lock = threading.Lock()
+
+
+def get_job_runner():
+    """프로세스당 하나의 JobRunner (첫 사용 시 생성)"""
+    global _runner
+    if _runner is None:
+        with _runner_lock:
+            if _runner is None:
+                _runner = JobRunner.from_env()
+    return _runner
@@ -0,0 +1,56 @@
+from sqlalchemy import JSON, Column, DateTime, Float, ForeignKey, Integer, String, Text
+
+from database import Base
+
+
+# 숙박 데이터 테이블 정의 (API 서버와 sync_data.py가 함께 사용)
+class Hotel(Base):
+    __tablename__ = "hotels"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String(255), nullable=False)
+    address = Column(String(500))
+    category = Column(String(100))
+    phone = Column(String(50))
+    homepage = Column(Text)
+    latitude = Column(Float)
+    longitude = Column(Float)
+    description = Column(Text)
+    content_id = Column(String(50), unique=True)
+
+
+# 비슷한 숙소 (similar.py가 매일 미리 계산, hotel_id + rank 기본 키로 한 번에 조회)
+class HotelSimilar(Base):
+    __tablename__ = "hotel_similar"
+
+    hotel_id = Column(Integer, ForeignKey("hotels.id", ondelete="CASCADE"), primary_key=True)
+    rank = Column(Integer, primary_key=True)
+    similar_id = Column(Integer, ForeignKey("hotels.id", ondelete="CASCADE"), nullable=False)
+    score = Column(Float, nullable=False)
+    computed_at = Column(DateTime, nullable=False)
+
+
+# 마지막 동기화 완료 시각 (DB 시계 기준)
+# 모든 워커·CLI가 같은 값을 보므로, 복제본 라우터가 이 값으로 read-your-writes 고정 여부를 판단
+class SyncState(Base):
+    __tablename__ = "sync_state"
+
+    name = Column(String(50), primary_key=True)
+    finished_at = Column(DateTime(timezone=True), nullable=False)
+
+
+# 백그라운드 작업 상태 (jobs.py JobStore가 기록)
+# 워커가 여러 개여도 어느 워커에서든 같은 작업 목록·상태를 조회할 수 있도록 DB에 둠
+class JobRecord(Base):
+    __tablename__ = "jobs"
+
+    id = Column(String(32), primary_key=True)
+    name = Column(String(50), nullable=False)
+    status = Column(String(20), nullable=False)
+    progress = Column(JSON)
+    result = Column(JSON)
+    error = Column(Text)
+    worker = Column(String(100))  # 실행한 프로세스 (호스트:pid)
+    created_at = Column(DateTime, nullable=False, index=True)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
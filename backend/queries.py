@@ -0,0 +1,100 @@
+"""
+목록·통계 조회 쿼리
+API 엔드포인트와 백그라운드 작업(캐시 워밍업, 통계 갱신)이 함께 사용합니다.
+SQLAlchemy·모델은 쿼리를 실행할 때 불러옵니다 (listing_key만 쓰는 API 모듈 import를 가볍게 유지).
+"""
+
+# hotel_similar에 숙소마다 저장하는 비슷한 숙소 수 (similar.py가 계산, API limit 상한)
+SIMILAR_TOP_K = 10
+
+
+def listing_key(page, limit, category=None, search_term=None):
+    """같은 결과를 내는 요청이 같은 키를 갖도록 파라미터 정규화"""
+    if category == "전체":
+        category = None
+    if search_term:
+        # ilike 검색이므로 대소문자·앞뒤 공백은 결과에 영향 없음
+        search_term = search_term.strip().lower() or None
+    return (page, limit, category or None, search_term or None)
+
+
+def fetch_hotel_page(db, page, limit, category=None, search_term=None):
+    """필터·페이지네이션을 적용한 전체 개수와 해당 페이지 행(dict) 조회"""
+    from models import Hotel
+
+    query = db.query(Hotel)
+
+    # 1. 카테고리 필터링 (한국관광공사 표준 분류 코드로 정확히 매칭)
+    if category:
+        query = query.filter(Hotel.category == category)
+
+    # 2. 통합 검색 필터 (이름 또는 주소)
+    if search_term:
+        search_pattern = f"%{search_term}%"
+        query = query.filter(
+            (Hotel.name.ilike(search_pattern)) |
+            (Hotel.address.ilike(search_pattern))
+        )
+
+    # 전체 개수
+    total = query.count()
+
+    # 결과 조회
+    skip = (page - 1) * limit
+    hotels = query.order_by(Hotel.id).offset(skip).limit(limit).all()
+
+    return {
+        "total": total,
+        "rows": [
+            {
+                "id": hotel.id,
+                "name": hotel.name,
+                "address": hotel.address,
+                "category": hotel.category,
+            }
+            for hotel in hotels
+        ],
+    }
+
+
+def fetch_similar(db, hotel_id, limit):
+    """미리 계산된 비슷한 숙소 (hotel_similar 기본 키 조회 + hotels 조인)"""
+    from models import Hotel, HotelSimilar
+
+    rows = (
+        db.query(HotelSimilar.score, Hotel)
+        .join(Hotel, Hotel.id == HotelSimilar.similar_id)
+        .filter(HotelSimilar.hotel_id == hotel_id)
+        .order_by(HotelSimilar.rank)
+        .limit(limit)
+        .all()
+    )
+    return [
+        {
+            "id": hotel.id,
+            "name": hotel.name,
+            "address": hotel.address,
+            "category": hotel.category,
+            "score": score,
+        }
+        for score, hotel in rows
+    ]
+
+
+def fetch_statistics(db):
+    """전체 숙소 수와 카테고리별 통계"""
+    from sqlalchemy import func
+
+    from models import Hotel
+
+    total_hotels = db.query(Hotel).count()
+
+    categories = db.query(
+        Hotel.category,
+        func.count(Hotel.id)
+    ).group_by(Hotel.category).all()
+
+    return {
+        "total_hotels": total_hotels,
+        "categories": {cat: count for cat, count in categories if cat},
+    }
@@ -5,7 +5,7 @@ from typing import Optional
 
 
 #패키지에서 필요한 모듈 임포트
-from database.connection import get_db_session
+from database.connection import get_read_session
 from database.models.hotel import Hotel
 from schemas.hotel import HotelResponse, HotelListResponse
 
@@ -16,7 +16,7 @@ async def list_hotels(
     q: Optional[str] = Query(None, description="검색어"),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    db: AsyncSession = Depends(get_db_session) #DB 세션 주입
+    db: AsyncSession = Depends(get_read_session) #조회용 세션 주입 (정상 복제본, 실패 시 primary)
 ):
     stmt = select(Hotel)
     if q:
@@ -35,7 +35,7 @@ async def list_hotels(
 @router.get("/{hotel_id}", response_model=HotelResponse)
 async def get_hotel(
     hotel_id:int, #DB 모델에 맞춰 int로 변경
-    db: AsyncSession = Depends(get_db_session)
+    db: AsyncSession = Depends(get_read_session)
 ):
     
     #단건 조회
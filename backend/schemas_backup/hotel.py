@@ -1,7 +1,10 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class HotelResponse(BaseModel):
+    # 엔드포인트가 SQLAlchemy Hotel 객체를 그대로 넘기므로 속성에서 읽음
+    model_config = ConfigDict(from_attributes=True)
+
     id: int
     name: str
     address: str | None
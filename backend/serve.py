@@ -0,0 +1,141 @@
+"""
+운영용 서버 실행
+
+    python serve.py [--workers N] [--port 8000] [--app main:app]
+
+- 워커 수: --workers > WEB_CONCURRENCY > CPU 코어 수
+- uvloop / httptools가 설치되어 있으면 사용
+- gunicorn이 있으면 preload로 앱 코드를 마스터에서 한 번만 import하고 워커가 공유,
+  fork 직후 워커마다 DB 커넥션 풀을 새로 만듦
+- 무중단 재시작 (gunicorn)
+    kill -HUP <master pid>   워커를 하나씩 새로 띄운 뒤 기존 워커 종료 (설정 변경 반영)
+    kill -USR2 <master pid>  새 코드로 새 마스터 실행 → 확인 후 기존 마스터에 QUIT
+- gunicorn이 없으면(Windows 등) uvicorn 멀티 프로세스로 실행 (preload 없음)
+"""
+import argparse
+import importlib.util
+import os
+
+
+# main.py가 첫 요청 때 불러오는 모듈 (preload 시 마스터에서 미리 import)
+PRELOAD_MODULES = ["sqlalchemy", "database", "models", "queries", "copywriting", "jobs"]
+
+
+def cpu_count():
+    # 컨테이너·taskset으로 제한된 경우 실제로 사용할 수 있는 코어 수
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def default_workers():
+    return int(os.getenv("WEB_CONCURRENCY", cpu_count()))
+
+
+def runtime_options():
+    """설치 여부에 따라 이벤트 루프·HTTP 파서 선택"""
+    return {
+        "loop": "uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        "http": "httptools" if importlib.util.find_spec("httptools") else "h11",
+    }
+
+
+def _uvicorn_worker_class():
+    try:
+        from uvicorn_worker import UvicornWorker
+    except ImportError:
+        from uvicorn.workers import UvicornWorker
+
+    class StaywiseWorker(UvicornWorker):
+        CONFIG_KWARGS = {**UvicornWorker.CONFIG_KWARGS, **runtime_options()}
+
+    return StaywiseWorker
+
+
+def post_fork(server, worker):
+    # preload 시 마스터에서 만든 커넥션 풀이 워커로 복사되므로,
+    # 부모의 소켓은 건드리지 않고(close=False) 워커 전용 풀을 새로 시작 (복제본 포함)
+    from database import get_router
+
+    get_router().dispose(close=False)
+
+
+def run_gunicorn(args):
+    from gunicorn.app.base import BaseApplication
+
+    class StaywiseApplication(BaseApplication):
+        def load_config(self):
+            options = {
+                "bind": f"{args.host}:{args.port}",
+                "workers": args.workers,
+                "worker_class": _uvicorn_worker_class(),
+                "preload_app": True,
+                "graceful_timeout": args.graceful_timeout,
+                "timeout": 60,
+                "keepalive": 5,
+                # 메모리 누수 대비 워커 주기적 교체 (동시에 교체되지 않도록 jitter)
+                "max_requests": args.max_requests,
+                "max_requests_jitter": max(args.max_requests // 10, 1) if args.max_requests else 0,
+                "post_fork": post_fork,
+                "pidfile": args.pidfile,
+            }
+            for key, value in options.items():
+                if value is not None:
+                    self.cfg.set(key, value)
+
+        def load(self):
+            from gunicorn.util import import_app
+
+            app = import_app(args.app)
+            # 요청 처리에 필요한 모듈을 마스터에서 미리 import해 워커가 공유 (DB 연결은 만들지 않음)
+            for module in PRELOAD_MODULES:
+                importlib.import_module(module)
+            return app
+
+    StaywiseApplication().run()
+
+
+def run_uvicorn(args):
+    import uvicorn
+
+    uvicorn.run(
+        args.app,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        timeout_graceful_shutdown=args.graceful_timeout,
+        limit_max_requests=args.max_requests or None,
+        **runtime_options(),
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="StayWise 운영 서버")
+    parser.add_argument("--app", default="main:app")
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=default_workers())
+    parser.add_argument("--graceful-timeout", type=int, default=30)
+    parser.add_argument("--max-requests", type=int, default=0)
+    parser.add_argument("--pidfile")
+    parser.add_argument("--no-gunicorn", action="store_true", help="gunicorn 대신 uvicorn 멀티 프로세스 사용")
+    args = parser.parse_args(argv)
+
+    use_gunicorn = not args.no_gunicorn and importlib.util.find_spec("gunicorn") is not None
+
+    print("\n" + "="*60)
+    print("🚀 StayWise 운영 서버 시작")
+    print("="*60)
+    print(f"📍 주소: http://{args.host}:{args.port}")
+    print(f"👷 워커: {args.workers}개 ({'gunicorn + preload' if use_gunicorn else 'uvicorn'})")
+    print(f"⚙️  런타임: {runtime_options()}")
+    print("="*60 + "\n")
+
+    if use_gunicorn:
+        run_gunicorn(args)
+    else:
+        run_uvicorn(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+"""
+비슷한 숙소 미리 계산
+
+카테고리·위치·숙박 속성(max_guests, bedrooms, 가격)으로 숙소마다 특징 벡터를 만들고,
+NumPy로 전체 카탈로그에 대해 최근접 이웃 top-k를 구해 hotel_similar 테이블에 저장합니다.
+/api/hotels/{id}/similar는 이 테이블을 기본 키로 한 번 조회만 합니다.
+"""
+import math
+import time
+from datetime import datetime
+
+import numpy as np
+
+from copywriting import generate_random_stay_info, stable_price
+from queries import SIMILAR_TOP_K
+
+DEFAULT_K = SIMILAR_TOP_K
+
+# 특징별 가중치 (거리 1 ≈ 같은 카테고리에서 10km 떨어짐 / 인원 2명 차이 / 가격 e배 차이)
+GEO_KM_PER_UNIT = 10.0
+CATEGORY_WEIGHT = 3.0
+GUESTS_WEIGHT = 0.5
+BEDROOMS_WEIGHT = 0.5
+PRICE_WEIGHT = 1.0
+
+EARTH_RADIUS_KM = 6371.0
+
+# 한 번에 거리를 계산할 행 수 (CHUNK × 후보 수 float32 행렬을 메모리에 올림)
+CHUNK_SIZE = 256
+
+# 후보 구간: 위치 z좌표(남북 방향) 차이가 BAND_RADIUS(× GEO_KM_PER_UNIT km) 이내인 숙소만 먼저 계산
+GEO_BAND_AXIS = 2
+BAND_RADIUS = 3.0
+
+
+def build_features(categories, latitudes, longitudes, max_guests, bedrooms, prices):
+    """
+    숙소별 특징 행렬 (n, d) float32
+    - 위치: 위경도를 단위 구 위의 xyz로 바꿔 유클리드 거리 ≈ 실제 거리
+      (좌표가 없는 숙소는 원점에 두어 위치가 있는 숙소와는 멀게 취급)
+    - 카테고리: one-hot
+    - max_guests, bedrooms, log(가격)
+    """
+    lat = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lon = np.radians(np.asarray(longitudes, dtype=np.float64))
+    has_coords = ~(np.isnan(lat) | np.isnan(lon))
+    lat = np.where(has_coords, lat, 0.0)
+    lon = np.where(has_coords, lon, 0.0)
+
+    geo = np.stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)], axis=1)
+    geo *= (EARTH_RADIUS_KM / GEO_KM_PER_UNIT) * has_coords[:, None]
+
+    codes, category_index = np.unique(np.asarray(categories, dtype=object).astype(str), return_inverse=True)
+    one_hot = np.zeros((len(category_index), len(codes)))
+    one_hot[np.arange(len(category_index)), category_index] = CATEGORY_WEIGHT / math.sqrt(2)
+
+    attributes = np.stack([
+        np.asarray(max_guests, dtype=np.float64) / 2 * GUESTS_WEIGHT,
+        np.asarray(bedrooms, dtype=np.float64) * BEDROOMS_WEIGHT,
+        np.log(np.asarray(prices, dtype=np.float64)) * PRICE_WEIGHT,
+    ], axis=1)
+
+    return np.hstack([geo, one_hot, attributes]).astype(np.float32)
+
+
+def _nearest(block, block_norms, candidates, candidate_norms, k, self_columns=None):
+    """block 각 행에 대해 candidates 중 가장 가까운 k개 (후보 내 위치, 거리²)"""
+    d2 = block @ candidates.T
+    d2 *= -2
+    d2 += block_norms[:, None]
+    d2 += candidate_norms[None, :]
+    if self_columns is not None:
+        d2[np.arange(len(block)), self_columns] = np.inf  # 자기 자신 제외
+
+    nearest = np.argpartition(d2, k - 1, axis=1)[:, :k]
+    nearest_d2 = np.take_along_axis(d2, nearest, axis=1)
+    order = np.argsort(nearest_d2, axis=1)
+    return np.take_along_axis(nearest, order, axis=1), np.take_along_axis(nearest_d2, order, axis=1)
+
+
+def top_k_neighbours(features, k=DEFAULT_K, chunk_size=CHUNK_SIZE, band_axis=None, band_radius=None, progress=None):
+    """
+    각 행의 자기 자신을 제외한 최근접 이웃 k개 (인덱스, 거리) — 둘 다 (n, k)
+    ||a-b||² = ||a||² + ||b||² - 2a·b 를 행 묶음 단위 행렬곱으로 계산
+
+    band_axis/band_radius를 주면 그 열 기준으로 정렬한 뒤, 묶음마다 해당 열 값 차이가
+    band_radius 이하인 연속 구간만 후보로 계산합니다. (한 열의 차이 ≤ 전체 거리이므로,
+    k번째 이웃이 band_radius 안에 있으면 정확한 결과이고, 아닌 행만 전체를 다시 계산)
+    """
+    n = len(features)
+    k = min(k, n - 1)
+    if k <= 0:
+        return np.empty((n, 0), dtype=np.int64), np.empty((n, 0), dtype=np.float32)
+
+    # 거리는 평행이동에 불변 → 중심을 원점으로 옮겨 float32 상쇄 오차를 줄임
+    features = features - features.mean(axis=0)
+
+    order = np.argsort(features[:, band_axis], kind="stable") if band_axis is not None else np.arange(n)
+    features = np.ascontiguousarray(features[order])
+    squared_norms = np.einsum("ij,ij->i", features, features)
+    keys = features[:, band_axis] if band_axis is not None else None
+
+    indices = np.empty((n, k), dtype=np.int64)
+    distances = np.empty((n, k), dtype=np.float32)
+
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        rows = np.arange(start, stop)
+        block, block_norms = features[start:stop], squared_norms[start:stop]
+
+        lo, hi = 0, n
+        if keys is not None:
+            lo = np.searchsorted(keys, keys[start] - band_radius, side="left")
+            hi = np.searchsorted(keys, keys[stop - 1] + band_radius, side="right")
+
+        if hi - lo > k:
+            nearest, nearest_d2 = _nearest(block, block_norms, features[lo:hi], squared_norms[lo:hi], k, rows - lo)
+            nearest += lo
+            retry = nearest_d2[:, -1] > band_radius ** 2 if keys is not None else np.zeros(len(rows), dtype=bool)
+        else:
+            nearest, nearest_d2 = None, None
+            retry = np.ones(len(rows), dtype=bool)
+
+        if retry.any():
+            # 구간 밖에 더 가까운 이웃이 있을 수 있는 행은 전체 후보로 다시 계산
+            full, full_d2 = _nearest(block[retry], block_norms[retry], features, squared_norms, k, rows[retry])
+            if nearest is None:
+                nearest, nearest_d2 = full, full_d2
+            else:
+                nearest[retry], nearest_d2[retry] = full, full_d2
+
+        indices[order[start:stop]] = order[nearest]
+        distances[order[start:stop]] = np.sqrt(np.maximum(nearest_d2, 0))
+
+        if progress:
+            progress(done=stop, total=n)
+
+    return indices, distances
+
+
+def compute_similar(rows, k=DEFAULT_K, progress=None):
+    """
+    rows: [(id, category, latitude, longitude), ...]
+    반환: (hotel_ids, 이웃 id 행렬 (n, k), 점수 행렬 (n, k))
+    숙박 속성은 API 응답과 같은 값이 나오도록 hotel_id를 seed로 생성합니다.
+    """
+    ids = np.array([r[0] for r in rows], dtype=np.int64)
+    stay_info = [generate_random_stay_info(seed=int(hotel_id)) for hotel_id in ids]
+
+    features = build_features(
+        categories=[r[1] or "" for r in rows],
+        latitudes=[np.nan if r[2] is None else r[2] for r in rows],
+        longitudes=[np.nan if r[3] is None else r[3] for r in rows],
+        max_guests=[s["max_guests"] for s in stay_info],
+        bedrooms=[s["bedrooms"] for s in stay_info],
+        prices=[stable_price(int(hotel_id)) for hotel_id in ids],
+    )
+    neighbours, distances = top_k_neighbours(
+        features, k=k, band_axis=GEO_BAND_AXIS, band_radius=BAND_RADIUS, progress=progress,
+    )
+    scores = 1.0 / (1.0 + distances)
+    return ids, ids[neighbours], scores
+
+
+def last_computed_at(engine):
+    """hotel_similar의 마지막 계산 시각 (아직 계산 전이거나 테이블이 없으면 None)"""
+    from sqlalchemy import func, select
+    from sqlalchemy.exc import SQLAlchemyError
+
+    from models import HotelSimilar
+
+    try:
+        with engine.connect() as conn:
+            return conn.execute(select(func.max(HotelSimilar.computed_at))).scalar()
+    except SQLAlchemyError:
+        return None
+
+
+def precompute_similar(engine, k=DEFAULT_K, progress=None, batch_size=10000):
+    """전체 숙소의 top-k를 계산해 hotel_similar 테이블을 한 트랜잭션에서 교체"""
+    from sqlalchemy import delete, insert, select
+
+    from models import Hotel, HotelSimilar
+
+    HotelSimilar.__table__.create(engine, checkfirst=True)
+
+    started = time.perf_counter()
+    with engine.connect() as conn:
+        rows = conn.execute(
+            select(Hotel.id, Hotel.category, Hotel.latitude, Hotel.longitude).order_by(Hotel.id)
+        ).all()
+
+    ids, neighbour_ids, scores = compute_similar(rows, k=k, progress=progress)
+    computed = time.perf_counter() - started
+
+    computed_at = datetime.now()
+    n, k = neighbour_ids.shape
+    # 전체 n*k행을 dict로 한꺼번에 만들지 않고, batch_size행 분량의 숙소씩 만들어 바로 저장
+    hotels_per_batch = max(batch_size // max(k, 1), 1)
+
+    with engine.begin() as conn:
+        conn.execute(delete(HotelSimilar))
+        for start in range(0, n, hotels_per_batch):
+            stop = min(start + hotels_per_batch, n)
+            batch_ids = ids[start:stop].tolist()
+            batch_neighbours = neighbour_ids[start:stop].tolist()
+            batch_scores = np.round(scores[start:stop].astype(np.float64), 4).tolist()
+            conn.execute(insert(HotelSimilar), [
+                {
+                    "hotel_id": hotel_id,
+                    "rank": rank + 1,
+                    "similar_id": similar_ids[rank],
+                    "score": row_scores[rank],
+                    "computed_at": computed_at,
+                }
+                for hotel_id, similar_ids, row_scores in zip(batch_ids, batch_neighbours, batch_scores)
+                for rank in range(k)
+            ])
+
+    return {
+        "hotels": n,
+        "rows": n * k,
+        "compute_seconds": round(computed, 3),
+        "total_seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+# 메인 실행 (API 서버 밖에서 cron 등으로 돌릴 때)
+if __name__ == "__main__":
+    import argparse
+
+    from database import get_engine
+    from jobs import exclusive_lock
+
+    parser = argparse.ArgumentParser(description="StayWise 비슷한 숙소 미리 계산")
+    parser.add_argument("--k", type=int, default=DEFAULT_K)
+    args = parser.parse_args()
+
+    print("\n" + "="*60)
+    print("🧮 비슷한 숙소 미리 계산 시작")
+    print("="*60 + "\n")
+
+    with exclusive_lock("similar"):
+        result = precompute_similar(get_engine(), k=args.k)
+
+    print(f"🎉 완료! 숙소 {result['hotels']:,}개, {result['rows']:,}행 저장 "
+          f"(계산 {result['compute_seconds']}s / 전체 {result['total_seconds']}s)")
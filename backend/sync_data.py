@@ -1,155 +1,177 @@
+import argparse
 import os
-import requests
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, Column, Integer, String, Float, Text
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+
+from ingestion import (
+    ADAPTERS,
+    Deduper,
+    FixtureTransport,
+    IngestionPipeline,
+    RecordingTransport,
+    print_report,
+)
 
 # .env 파일에서 환경 변수 불러오기
 load_dotenv()
 
-# 데이터베이스 연결 설정
-DATABASE_URL = os.getenv("DATABASE_URL")
-SERVICE_KEY = os.getenv("DATA_GO_KR_SERVICE_KEY")
 
-if not DATABASE_URL:
-    raise ValueError("❌ DATABASE_URL이 .env 파일에 설정되지 않았습니다!")
-if not SERVICE_KEY:
-    raise ValueError("❌ DATA_GO_KR_SERVICE_KEY가 .env 파일에 설정되지 않았습니다!")
+def check_settings(require_service_key=True):
+    """필수 환경 변수 확인 (import 시점이 아닌 실행 시점에 검사)"""
+    if not os.getenv("DATABASE_URL"):
+        raise ValueError("❌ DATABASE_URL이 .env 파일에 설정되지 않았습니다!")
+    if require_service_key and not os.getenv("DATA_GO_KR_SERVICE_KEY"):
+        raise ValueError("❌ DATA_GO_KR_SERVICE_KEY가 .env 파일에 설정되지 않았습니다!")
 
-# SQLAlchemy 엔진 생성
-engine = create_engine(DATABASE_URL)
-Base = declarative_base()
 
-# 숙박 데이터 테이블 정의
-class Hotel(Base):
-    __tablename__ = "hotels"
-    
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    name = Column(String(255), nullable=False)
-    address = Column(String(500))
-    category = Column(String(100))
-    phone = Column(String(50))
-    homepage = Column(Text)
-    latitude = Column(Float)
-    longitude = Column(Float)
-    description = Column(Text)
-    content_id = Column(String(50), unique=True)
-
-# 테이블 생성
-print("📊 데이터베이스 테이블 생성 중...")
-Base.metadata.create_all(engine)
-print("✅ 테이블 생성 완료!")
-
-# 세션 생성
-Session = sessionmaker(bind=engine)
-session = Session()
-
-# 공공데이터포털 API 호출 함수
-def fetch_accommodation_data(page_no=1, num_of_rows=100):
-    """한국관광공사 숙박정보 API 호출 (GW 버전)"""
-    # searchStay2 사용 (숙박정보 전용 엔드포인트)
-    base_url = "http://apis.data.go.kr/B551011/KorService2/searchStay2"
-    
-    params = {
-        "serviceKey": SERVICE_KEY,
-        "numOfRows": num_of_rows,
-        "pageNo": page_no,
-        "MobileOS": "ETC",
-        "MobileApp": "StayWise",
-        "_type": "json"
-        # listYN, arrange 파라미터 제거 (searchStay2는 지원 안 함)
-    }
-    
+# 데이터 저장 함수 (파이프라인 write 단계)
+def make_batch_writer(session, progress=None):
+    """정규화된 숙박 레코드 배치를 한 번에 저장하는 write 함수 생성"""
+    from models import Hotel
+
+    state = {"saved": 0}
+
+    def write_hotels_batch(records):
+        content_ids = [r["content_id"] for r in records]
+        existing = {
+            cid for (cid,) in
+            session.query(Hotel.content_id).filter(Hotel.content_id.in_(content_ids))
+        }
+        new_records = [r for r in records if r["content_id"] not in existing]
+
+        if new_records:
+            session.bulk_insert_mappings(Hotel, new_records)
+            session.commit()
+            print(f"✅ {len(new_records)}개의 새 숙박 정보 저장 완료!")
+
+        state["saved"] += len(new_records)
+        if progress:
+            progress(saved=state["saved"])
+        return len(new_records)
+
+    return write_hotels_batch
+
+
+def record_sync_finished(engine, name="hotels"):
+    """
+    동기화 완료 시각을 primary의 sync_state에 기록 (DB 시계 기준)
+    API 워커들의 복제본 라우터가 이 값을 읽어 일정 시간 조회를 primary로 보냄
+    """
+    from sqlalchemy import delete, func, insert
+
+    from models import SyncState
+
+    with engine.begin() as conn:
+        conn.execute(delete(SyncState).where(SyncState.name == name))
+        conn.execute(insert(SyncState).values(name=name, finished_at=func.now()))
+
+
+def last_sync_age(engine, name="hotels"):
+    """마지막 동기화 완료 후 지난 초 (DB 시계 기준, 기록이 없으면 None)"""
+    from sqlalchemy import func, select
+    from sqlalchemy.exc import SQLAlchemyError
+
+    from models import SyncState
+
     try:
-        print(f"🔍 API 호출 중... (페이지: {page_no})")
-        response = requests.get(base_url, params=params, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        if "response" not in data:
-            print("⚠️ 예상치 못한 API 응답 형식:", data)
-            return []
-        
-        body = data["response"].get("body")
-        if not body:
-            print("⚠️ body 데이터가 없습니다.")
-            return []
-        
-        items = body.get("items")
-        if not items or not items.get("item"):
-            print("ℹ️ 더 이상 데이터가 없습니다.")
-            return []
-        
-        return items["item"]
-    
-    except requests.exceptions.RequestException as e:
-        print(f"❌ API 호출 실패: {e}")
-        return []
-
-# 데이터 저장 함수
-def save_hotels_to_db(hotels_data):
-    """받아온 숙박 데이터를 DB에 저장"""
-    saved_count = 0
-    
-    for item in hotels_data:
-        content_id = item.get("contentid")
-        
-        existing = session.query(Hotel).filter_by(content_id=str(content_id)).first()
-        if existing:
-            continue
-        
-        hotel = Hotel(
-            name=item.get("title", "정보 없음"),
-            address=item.get("addr1", "") + " " + item.get("addr2", "").strip(),
-            category=item.get("cat3", "기타"),
-            phone=item.get("tel", ""),
-            homepage=item.get("homepage", ""),
-            latitude=float(item.get("mapy", 0)) if item.get("mapy") else None,
-            longitude=float(item.get("mapx", 0)) if item.get("mapx") else None,
-            description=item.get("overview", ""),
-            content_id=str(content_id)
+        with engine.connect() as conn:
+            row = conn.execute(
+                select(SyncState.finished_at, func.now()).where(SyncState.name == name)
+            ).first()
+    except SQLAlchemyError:
+        return None
+    if row is None:
+        return None
+    finished_at, db_now = row
+    return (db_now - finished_at).total_seconds()
+
+
+def build_adapters(sources, fixtures_dir=None, record_dir=None, max_pages=5):
+    """소스 이름 목록으로 어댑터 생성 (fixtures_dir가 있으면 녹화본 재생)"""
+    adapters = []
+    for source in sources:
+        transport = None
+        if fixtures_dir:
+            transport = FixtureTransport(os.path.join(fixtures_dir, source))
+        elif record_dir:
+            transport = RecordingTransport(os.path.join(record_dir, source))
+        adapters.append(ADAPTERS[source](
+            service_key=os.getenv("DATA_GO_KR_SERVICE_KEY"),
+            transport=transport,
+            num_of_rows=100,
+            max_pages=max_pages,
+        ))
+    return adapters
+
+
+def run_sync(sources=None, max_pages=5, fixtures_dir=None, record_dir=None, engine=None, progress=None):
+    """
+    숙박 데이터 동기화 1회 실행
+    API 서버의 백그라운드 작업(jobs.py)과 CLI가 함께 사용합니다.
+    반환값: {"saved": 저장 건수, "stages": 단계별 처리량}
+    """
+    check_settings(require_service_key=not fixtures_dir)
+
+    from sqlalchemy.orm import sessionmaker
+
+    from database import Base, get_engine
+    from models import Hotel
+
+    engine = engine or get_engine()
+
+    # 테이블 생성
+    print("📊 데이터베이스 테이블 확인 중...")
+    Base.metadata.create_all(engine)
+
+    session = sessionmaker(bind=engine)()
+    try:
+        adapters = build_adapters(
+            sources or list(ADAPTERS),
+            fixtures_dir=fixtures_dir,
+            record_dir=record_dir,
+            max_pages=max_pages,
         )
-        
-        session.add(hotel)
-        saved_count += 1
-    
-    if saved_count > 0:
-        session.commit()
-        print(f"✅ {saved_count}개의 새 숙박 정보 저장 완료!")
-    else:
-        print("ℹ️ 새로 저장할 데이터가 없습니다.")
-    
-    return saved_count
+
+        # DB에 이미 있는 숙소로 중복 판정 초기화 (소스 간 중복 방지)
+        deduper = Deduper()
+        deduper.seed(session.query(Hotel.name, Hotel.address, Hotel.latitude, Hotel.longitude, Hotel.content_id))
+
+        pipeline = IngestionPipeline(adapters, make_batch_writer(session, progress), deduper=deduper)
+        report = pipeline.run()
+        record_sync_finished(engine)
+        return {"saved": pipeline.saved, "stages": report}
+    finally:
+        session.close()
+
 
 # 메인 실행
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="StayWise 숙박 데이터 동기화")
+    parser.add_argument("--sources", nargs="+", choices=list(ADAPTERS), default=list(ADAPTERS))
+    parser.add_argument("--max-pages", type=int, default=5)
+    parser.add_argument("--fixtures", help="녹화된 응답 디렉터리 (네트워크 없이 실행)")
+    parser.add_argument("--record", help="실제 API 응답을 녹화할 디렉터리")
+    args = parser.parse_args()
+
     print("\n" + "="*60)
     print("🏨 StayWise 숙박 데이터 동기화 시작")
     print("="*60 + "\n")
-    
-    total_saved = 0
-    page = 1
-    max_pages = 5
-    
-    while page <= max_pages:
-        hotels = fetch_accommodation_data(page_no=page, num_of_rows=100)
-        
-        if not hotels:
-            print(f"📄 {page}페이지에서 데이터 없음. 종료합니다.")
-            break
-        
-        saved = save_hotels_to_db(hotels)
-        total_saved += saved
-        
-        print(f"📄 페이지 {page} 처리 완료 (누적 저장: {total_saved}개)\n")
-        page += 1
-    
+
+    result = run_sync(
+        sources=args.sources,
+        max_pages=args.max_pages,
+        fixtures_dir=args.fixtures,
+        record_dir=args.record,
+    )
+
     print("="*60)
-    print(f"🎉 동기화 완료! 총 {total_saved}개의 숙박 정보가 저장되었습니다.")
+    print(f"🎉 동기화 완료! 총 {result['saved']}개의 숙박 정보가 저장되었습니다.")
     print("="*60)
-    
+    print_report(result["stages"])
+
+    from database import SessionLocal
+    from models import Hotel
+
+    session = SessionLocal()
     total_count = session.query(Hotel).count()
     print(f"\n📊 현재 DB에 저장된 총 숙박 정보: {total_count}개")
     
@@ -160,4 +182,4 @@ if __name__ == "__main__":
             print(f"  - {h.name} ({h.address})")
     
     session.close()
-    print("\n✅ 모든 작업이 완료되었습니다!")
\ No newline at end of file
+    print("\n✅ 모든 작업이 완료되었습니다!")
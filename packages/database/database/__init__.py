@@ -1,2 +1,2 @@
-from .connection import db_manager, get_db_session
+from .connection import db_manager, get_db_session, get_read_session
 
@@ -1,24 +1,131 @@
-from typing import AsyncGenerator
+import itertools
+import time
+from typing import AsyncGenerator, Optional
 
+from sqlalchemy import DateTime, column, func, select, table, text
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 
+# backend의 sync_data.py가 동기화 완료 시 기록하는 표 (backend/models.py SyncState)
+sync_state = table("sync_state", column("name"), column("finished_at", DateTime(timezone=True)))
+
+
+def _async_url(db_url: str) -> str:
+    # SQLAlchemy async engine needs an async driver in URL.
+    if db_url.startswith("postgresql://"):
+        return db_url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if db_url.startswith("sqlite://"):
+        return db_url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return db_url
+
+
 class DatabaseManager:
+    """
+    primary(쓰기) + replica(읽기) 엔진 관리
+    - read_session_maker(): 정상 복제본을 라운드로빈으로, 없거나 모두 비정상이면 primary
+    - 동기화 완료 시각(sync_state)을 sync_check_interval초마다 primary에서 읽어,
+      pin_seconds가 지나기 전에는 읽기를 primary로 고정 (read-your-writes, 모든 워커 공통)
+    - pin_primary(seconds): 이 프로세스만 일정 시간 primary로 고정
+    """
+
     def __init__(self):
         self.engine = None
         self.session_maker = None
+        self.replicas = []
+        self.health_interval = 30.0
+        self.pin_seconds = 60.0
+        self.sync_check_interval = 5.0
+        self._sync_checked_at = None
+        self._healthy = {}
+        self._checked_at = {}
+        self._cycle = None
+        self._pinned_until = 0.0
 
-    def init(self, db_url: str):
-        normalized_url = db_url
-        if normalized_url.startswith("postgresql://"):
-            normalized_url = normalized_url.replace("postgresql://", "postgresql+asyncpg://", 1)
-
-        self.engine = create_async_engine(normalized_url, echo=True)
+    def init(
+        self,
+        db_url: str,
+        replica_urls: Optional[list[str]] = None,
+        health_interval: float = 30.0,
+        pin_seconds: float = 60.0,
+        sync_check_interval: float = 5.0,
+    ):
+        self.engine = create_async_engine(_async_url(db_url), echo=True)
         self.session_maker = async_sessionmaker(self.engine, expire_on_commit=False)
 
+        self.health_interval = health_interval
+        self.pin_seconds = pin_seconds
+        self.sync_check_interval = sync_check_interval
+        self._sync_checked_at = None
+        # pool_pre_ping: 죽은 복제본 연결을 세션 시작 시점에 감지해 primary로 대체할 수 있게 함
+        self.replicas = [
+            async_sessionmaker(create_async_engine(_async_url(url), pool_pre_ping=True), expire_on_commit=False)
+            for url in replica_urls or []
+        ]
+        self._healthy = {id(r): True for r in self.replicas}
+        self._checked_at = {id(r): 0.0 for r in self.replicas}
+        self._cycle = itertools.cycle(self.replicas) if self.replicas else None
+
+    def pin_primary(self, seconds: Optional[float] = None):
+        if seconds is None:
+            seconds = self.pin_seconds
+        self._pinned_until = max(self._pinned_until, time.monotonic() + seconds)
+
+    async def refresh_sync_pin(self, force: bool = False):
+        """primary의 마지막 동기화 시각(DB 시계 기준)을 읽어 pin_seconds 안이면 primary로 고정"""
+        now = time.monotonic()
+        if not force and self._sync_checked_at is not None and now - self._sync_checked_at < self.sync_check_interval:
+            return
+        self._sync_checked_at = now
+
+        try:
+            async with self.engine.connect() as conn:
+                row = (await conn.execute(
+                    select(sync_state.c.finished_at, func.now()).where(sync_state.c.name == "hotels")
+                )).first()
+        except SQLAlchemyError:
+            return
+
+        if row is not None:
+            finished_at, db_now = row
+            remaining = self.pin_seconds - (db_now - finished_at).total_seconds()
+            if remaining > 0:
+                self.pin_primary(remaining)
+
+    async def read_session_maker(self) -> async_sessionmaker:
+        if not self.replicas:
+            return self.session_maker
+        await self.refresh_sync_pin()
+        if time.monotonic() < self._pinned_until:
+            return self.session_maker
+
+        for _ in range(len(self.replicas)):
+            replica = next(self._cycle)
+            if await self._is_healthy(replica):
+                return replica
+        return self.session_maker
+
+    async def _is_healthy(self, replica: async_sessionmaker) -> bool:
+        key = id(replica)
+        if time.monotonic() - self._checked_at[key] >= self.health_interval:
+            try:
+                async with replica.kw["bind"].connect() as conn:
+                    await conn.execute(text("SELECT 1"))
+                self._healthy[key] = True
+            except Exception:
+                self._healthy[key] = False
+            self._checked_at[key] = time.monotonic()
+        return self._healthy[key]
+
+    def mark_down(self, replica: async_sessionmaker):
+        self._healthy[id(replica)] = False
+        self._checked_at[id(replica)] = time.monotonic()
+
     async def close(self):
         if self.engine:
             await self.engine.dispose()
+        for replica in self.replicas:
+            await replica.kw["bind"].dispose()
 
 
 db_manager = DatabaseManager()
@@ -28,3 +135,30 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     async with db_manager.session_maker() as session:
         yield session
 
+
+async def get_read_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    조회 전용 엔드포인트용 세션
+    복제본에 연결할 수 없으면 해당 복제본을 비정상으로 표시하고 primary 세션을 대신 제공
+    (연결 이후 조회 중 실패는 요청을 다시 실행할 수 없으므로 비정상 표시 후 그대로 발생)
+    """
+    maker = await db_manager.read_session_maker()
+    if maker is not db_manager.session_maker:
+        session = maker()
+        try:
+            await session.connection()
+        except OperationalError:
+            await session.close()
+            db_manager.mark_down(maker)
+            maker = db_manager.session_maker
+        else:
+            async with session:
+                try:
+                    yield session
+                except OperationalError:
+                    db_manager.mark_down(maker)
+                    raise
+            return
+
+    async with maker() as session:
+        yield session
@@ -4,12 +4,21 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from config import settings
+from database import db_manager
 from routers import health, hotels
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # primary + 읽기 복제본 연결 (조회 엔드포인트는 get_read_session 사용)
+    db_manager.init(
+        settings.database_url,
+        replica_urls=settings.replica_url_list,
+        health_interval=settings.replica_health_interval,
+        pin_seconds=settings.replica_pin_seconds,
+    )
     yield
+    await db_manager.close()
 
 
 app = FastAPI(